@@ -6,71 +6,337 @@ core functionality for tool management, task execution, and memory.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+from typing import List, Dict, Any, Optional, Set, Tuple
+from collections import OrderedDict, defaultdict, deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+import functools
+import heapq
+import logging
+import re
+import time
+import zlib
+import orjson
 import structlog
-from pydantic import BaseModel, Field
+
+from app.utils.logging import is_enabled_for
+
+try:
+    import faiss
+    import numpy as np
+except ImportError:  # faiss is optional - only needed for semantic memory
+    faiss = None
+    np = None
 
 
 logger = structlog.get_logger(__name__)
 
+# Maximum number of events kept in short-term memory
+SHORT_TERM_LIMIT = 100
+
+# Maximum number of entries kept in the context cache (LRU beyond this)
+CONTEXT_CACHE_LIMIT = 256
+
+# Tokenizer used by the AgentMemory keyword index
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+# Semantic memory tuning
+SEMANTIC_RECALL_THRESHOLD = 0.40
+SEMANTIC_DUPLICATE_THRESHOLD = 0.95
+_SEMANTIC_TEXT_LIMIT = 2000
+
+
+# zlib level used for compressed context entries
+_CONTEXT_COMPRESSION_LEVEL = 6
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize an event or context value to JSON bytes"""
+    return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
 
-class AgentCapability(BaseModel):
+
+def _to_search_text(obj: Any) -> str:
+    """Serialize an event or context value to JSON text for indexing"""
+    return _dumps(obj).decode()
+
+
+# Internal DTOs are plain slotted dataclasses: they are built on every task
+# and capability lookup, and never validated from untrusted input here.
+# Pydantic models at the API boundary can still embed them as fields.
+@dataclass(slots=True, kw_only=True, frozen=True)
+class AgentCapability:
     """Represents a capability that an agent has"""
     name: str
     description: str
-    requires_tools: List[str] = Field(default_factory=list)
+    requires_tools: Tuple[str, ...] = ()
 
 
-class Task(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class Task:
     """Represents a task that an agent can execute"""
     id: str
     action: str
-    params: Dict[str, Any] = Field(default_factory=dict)
-    context: Dict[str, Any] = Field(default_factory=dict)
+    params: Dict[str, Any] = field(default_factory=dict)
+    context: Dict[str, Any] = field(default_factory=dict)
     priority: int = 1
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at_ns: int = field(default_factory=time.time_ns)
+
+    @property
+    def created_at(self) -> datetime:
+        """Creation time as a UTC datetime (built on demand)"""
+        return datetime.fromtimestamp(self.created_at_ns / 1e9, tz=timezone.utc)
 
 
-class AgentResult(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class AgentResult:
     """Result of an agent's task execution"""
     task_id: str
     success: bool
     data: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
     execution_time_ms: float
-    tool_calls: List[str] = Field(default_factory=list)
-    metadata: Dict[str, Any] = Field(default_factory=dict)
+    tool_calls: List[str] = field(default_factory=list)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+@functools.lru_cache(maxsize=256)
+def _make_capability(name: str, description: str) -> AgentCapability:
+    """Build (or reuse) the immutable capability for a tool"""
+    return AgentCapability(
+        name=name,
+        description=description,
+        requires_tools=(name,)
+    )
 
 
 class AgentMemory:
-    """Memory system for agents to store and retrieve information"""
+    """
+    Memory system for agents to store and retrieve information.
 
-    def __init__(self):
-        self.short_term: List[Dict[str, Any]] = []
+    Keyword recall is always available. Passing an ``embedder`` (any object
+    with an ``encode(text)`` method, e.g. a SentenceTransformer) enables
+    semantic recall over short-term events and cached context through a
+    FAISS inner-product index on L2-normalized vectors.
+    """
+
+    __slots__ = (
+        'short_term',
+        'long_term',
+        'context_cache',
+        '_index',
+        '_events_by_id',
+        '_tokens_by_id',
+        '_short_term_ids',
+        '_next_event_id',
+        '_embedder',
+        '_semantic_index',
+        '_semantic_entries',
+        '_semantic_id_by_event',
+        '_semantic_id_by_context',
+        '_next_semantic_id'
+    )
+
+    def __init__(self, embedder: Optional[Any] = None):
+        self.short_term: deque = deque(maxlen=SHORT_TERM_LIMIT)
         self.long_term: Dict[str, Any] = {}
-        self.context_cache: Dict[str, Any] = {}
+        self.context_cache: OrderedDict = OrderedDict()
+
+        # Inverted keyword index over short-term memory (token -> event ids)
+        self._index: Dict[str, Set[int]] = defaultdict(set)
+        self._events_by_id: Dict[int, Dict[str, Any]] = {}
+        self._tokens_by_id: Dict[int, Set[str]] = {}
+        self._short_term_ids: deque = deque(maxlen=SHORT_TERM_LIMIT)
+        self._next_event_id = 0
+
+        # Optional semantic index (built lazily once the embedding size is known)
+        if embedder is not None and faiss is None:
+            raise ImportError(
+                "Semantic memory requires the 'faiss-cpu' package"
+            )
+        self._embedder = embedder
+        self._semantic_index = None
+        self._semantic_entries: Dict[int, Dict[str, Any]] = {}
+        self._semantic_id_by_event: Dict[int, int] = {}
+        self._semantic_id_by_context: Dict[str, int] = {}
+        self._next_semantic_id = 0
+
+    @property
+    def semantic_enabled(self) -> bool:
+        """Whether semantic recall is available"""
+        return self._embedder is not None
+
+    @staticmethod
+    def _tokenize(text: str) -> Set[str]:
+        """Split text into lowercase keyword tokens"""
+        return set(_TOKEN_PATTERN.findall(text.lower()))
 
     def remember(self, event: Dict[str, Any]):
         """Store an event in short-term memory"""
-        self.short_term.append({
+        record = {
             **event,
             'timestamp': datetime.utcnow()
-        })
-        # Keep only last 100 events in short-term memory
-        if len(self.short_term) > 100:
-            self.short_term = self.short_term[-100:]
+        }
+        event_id = self._next_event_id
+        self._next_event_id += 1
+
+        # Serialize and tokenize once at write time so recall never
+        # re-serializes events
+        search_text = _to_search_text(event)
+        tokens = self._tokenize(search_text)
+        for token in tokens:
+            self._index[token].add(event_id)
+        self._events_by_id[event_id] = record
+        self._tokens_by_id[event_id] = tokens
+
+        if self._embedder is not None:
+            self._index_semantic(
+                search_text,
+                {'source': 'short_term', 'event_id': event_id, 'value': record}
+            )
+
+        # The bounded deques drop the oldest event once full; unindex it first
+        if len(self._short_term_ids) == self._short_term_ids.maxlen:
+            self._forget(self._short_term_ids[0])
+        self.short_term.append(record)
+        self._short_term_ids.append(event_id)
+
+    def _forget(self, event_id: int):
+        """Remove an evicted event from the keyword and semantic indexes"""
+        self._events_by_id.pop(event_id, None)
+        semantic_id = self._semantic_id_by_event.pop(event_id, None)
+        if semantic_id is not None:
+            self._remove_semantic(semantic_id)
+        for token in self._tokens_by_id.pop(event_id, ()):
+            postings = self._index.get(token)
+            if postings is not None:
+                postings.discard(event_id)
+                if not postings:
+                    del self._index[token]
 
     def recall(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
         """Retrieve relevant memories based on query"""
-        # Simple implementation - can be enhanced with semantic search
-        results = []
-        for event in reversed(self.short_term):
-            if query.lower() in str(event).lower():
-                results.append(event)
-                if len(results) >= limit:
-                    break
-        return results
+        query_tokens = self._tokenize(query)
+        if not query_tokens:
+            return []
+
+        postings = [self._index.get(token, set()) for token in query_tokens]
+        matches = set.intersection(*postings)
+        if not matches:
+            # No event contains every token - fall back to any-token matches
+            matches = set.union(*postings)
+
+        # Event ids are monotonic, so the largest ids are the most recent
+        return [
+            self._events_by_id[event_id]
+            for event_id in heapq.nlargest(limit, matches)
+        ]
+
+    def _embed(self, text: str):
+        """Embed text as a normalized float32 row vector"""
+        vector = np.asarray(
+            self._embedder.encode(text[:_SEMANTIC_TEXT_LIMIT]),
+            dtype='float32'
+        ).reshape(1, -1)
+        faiss.normalize_L2(vector)
+        return vector
+
+    def _index_semantic(self, text: str, entry: Dict[str, Any]):
+        """Add an entry to the semantic index, merging near-duplicates"""
+        vector = self._embed(text)
+        if self._semantic_index is None:
+            self._semantic_index = faiss.IndexIDMap(
+                faiss.IndexFlatIP(vector.shape[1])
+            )
+
+        semantic_id = None
+        if entry['source'] == 'context':
+            semantic_id = self._semantic_id_by_context.get(entry['key'])
+        if semantic_id is None and self._semantic_index.ntotal:
+            scores, ids = self._semantic_index.search(vector, 1)
+            existing = self._semantic_entries.get(int(ids[0][0]))
+            if (
+                scores[0][0] > SEMANTIC_DUPLICATE_THRESHOLD
+                and existing is not None
+                and existing['source'] == entry['source']
+            ):
+                semantic_id = int(ids[0][0])
+
+        if semantic_id is None:
+            semantic_id = self._next_semantic_id
+            self._next_semantic_id += 1
+        else:
+            # Update in place: drop the stale vector and its back-reference
+            self._remove_semantic(semantic_id)
+
+        self._semantic_index.add_with_ids(
+            vector, np.array([semantic_id], dtype='int64')
+        )
+        self._semantic_entries[semantic_id] = entry
+        if entry['source'] == 'short_term':
+            self._semantic_id_by_event[entry['event_id']] = semantic_id
+        else:
+            self._semantic_id_by_context[entry['key']] = semantic_id
+
+    def _remove_semantic(self, semantic_id: int):
+        """Remove an entry from the semantic index"""
+        entry = self._semantic_entries.pop(semantic_id, None)
+        if entry is None:
+            return
+        if entry['source'] == 'short_term':
+            self._semantic_id_by_event.pop(entry['event_id'], None)
+        else:
+            self._semantic_id_by_context.pop(entry['key'], None)
+        self._semantic_index.remove_ids(np.array([semantic_id], dtype='int64'))
+
+    def recall_semantic(
+        self,
+        query: str,
+        k: int = 10,
+        tau: float = SEMANTIC_RECALL_THRESHOLD
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieve memories whose meaning is similar to the query.
+
+        Args:
+            query: Free-text query
+            k: Maximum number of matches to return
+            tau: Minimum cosine similarity for a match
+
+        Returns:
+            List of matches with 'source', 'key', 'score' and 'value',
+            ordered by decreasing similarity
+
+        Raises:
+            RuntimeError: If the memory was created without an embedder
+        """
+        if self._embedder is None:
+            raise RuntimeError("Semantic recall requires an embedder")
+        if self._semantic_index is None or not self._semantic_index.ntotal:
+            return []
+
+        scores, ids = self._semantic_index.search(self._embed(query), k)
+        now = time.monotonic()
+        matches = []
+        for score, semantic_id in zip(scores[0], ids[0]):
+            if semantic_id < 0 or score < tau:
+                continue
+            entry = self._semantic_entries.get(int(semantic_id))
+            if entry is None:
+                continue
+            if entry['source'] == 'context':
+                cached = self.context_cache.get(entry['key'])
+                if not cached or now >= cached['expires_at']:
+                    continue
+                value = self._context_value(cached)
+            else:
+                value = entry['value']
+            matches.append({
+                'source': entry['source'],
+                'key': entry.get('key'),
+                'score': float(score),
+                'value': value
+            })
+        return matches
 
     def learn_pattern(self, pattern_name: str, pattern_data: Any):
         """Store a learned pattern in long-term memory"""
@@ -84,19 +350,80 @@ class AgentMemory:
         pattern = self.long_term.get(pattern_name)
         return pattern['data'] if pattern else None
 
-    def cache_context(self, key: str, value: Any, ttl_seconds: int = 3600):
-        """Cache context information with TTL"""
+    def cache_context(
+        self,
+        key: str,
+        value: Any,
+        ttl_seconds: int = 3600,
+        compress: bool = False
+    ):
+        """
+        Cache context information with TTL (tracked on the monotonic clock).
+
+        The cache is bounded to CONTEXT_CACHE_LIMIT entries; the least
+        recently used entries are evicted first, and expired entries at
+        the LRU end are dropped as new ones arrive.
+
+        With ``compress=True`` the value is stored as zlib-compressed
+        JSON instead of by reference, which keeps large reports from
+        pinning their full object graph in memory. It is decoded again
+        on read, so it comes back as plain JSON types.
+        """
+        now = time.monotonic()
+        serialized = _dumps(value) if compress else None
         self.context_cache[key] = {
-            'value': value,
-            'expires_at': datetime.utcnow().timestamp() + ttl_seconds
+            'value': (
+                zlib.compress(serialized, _CONTEXT_COMPRESSION_LEVEL)
+                if compress else value
+            ),
+            'compressed': compress,
+            'expires_at': now + ttl_seconds
         }
+        self.context_cache.move_to_end(key)
+
+        while self.context_cache:
+            oldest_key, oldest = next(iter(self.context_cache.items()))
+            if (
+                len(self.context_cache) <= CONTEXT_CACHE_LIMIT
+                and now < oldest['expires_at']
+            ):
+                break
+            del self.context_cache[oldest_key]
+            self._forget_context(oldest_key)
+
+        if self._embedder is not None and key in self.context_cache:
+            search_text = (
+                serialized.decode() if compress else _to_search_text(value)
+            )
+            self._index_semantic(
+                f"{key}: {search_text}",
+                {'source': 'context', 'key': key}
+            )
+
+    @staticmethod
+    def _context_value(cached: Dict[str, Any]) -> Any:
+        """Return a cache entry's value, decompressing it if needed"""
+        if cached['compressed']:
+            return orjson.loads(zlib.decompress(cached['value']))
+        return cached['value']
 
     def get_cached_context(self, key: str) -> Optional[Any]:
         """Retrieve cached context if not expired"""
         cached = self.context_cache.get(key)
-        if cached and datetime.utcnow().timestamp() < cached['expires_at']:
-            return cached['value']
-        return None
+        if cached is None:
+            return None
+        if time.monotonic() >= cached['expires_at']:
+            del self.context_cache[key]
+            self._forget_context(key)
+            return None
+        self.context_cache.move_to_end(key)
+        return self._context_value(cached)
+
+    def _forget_context(self, key: str):
+        """Remove an evicted context entry from the semantic index"""
+        semantic_id = self._semantic_id_by_context.get(key)
+        if semantic_id is not None:
+            self._remove_semantic(semantic_id)
 
 
 class Agent(ABC):
@@ -107,6 +434,20 @@ class Agent(ABC):
     Each agent has a specific purpose and set of capabilities.
     """
 
+    __slots__ = (
+        'name',
+        'description',
+        'version',
+        'tools',
+        '_capabilities_cache',
+        '_capabilities_schema',
+        'memory',
+        'logger',
+        'enabled',
+        'stats',
+        '_stats_cache'
+    )
+
     def __init__(
         self,
         name: str,
@@ -125,6 +466,8 @@ class Agent(ABC):
         self.description = description
         self.version = version
         self.tools: Dict[str, Any] = {}
+        self._capabilities_cache: Optional[List[AgentCapability]] = None
+        self._capabilities_schema: Optional[List[Dict[str, Any]]] = None
         self.memory = AgentMemory()
         self.logger = structlog.get_logger(name)
         self.enabled = True
@@ -136,6 +479,7 @@ class Agent(ABC):
             'tasks_failed': 0,
             'total_execution_time_ms': 0.0
         }
+        self._stats_cache: Optional[Dict[str, Any]] = None
 
     @abstractmethod
     async def execute(self, task: Task) -> AgentResult:
@@ -161,6 +505,8 @@ class Agent(ABC):
             tool: Tool instance to register
         """
         self.tools[tool.name] = tool
+        self._capabilities_cache = None
+        self._capabilities_schema = None
         self.logger.info(
             "tool_registered",
             agent=self.name,
@@ -176,6 +522,8 @@ class Agent(ABC):
         """
         if tool_name in self.tools:
             del self.tools[tool_name]
+            self._capabilities_cache = None
+            self._capabilities_schema = None
             self.logger.info(
                 "tool_unregistered",
                 agent=self.name,
@@ -190,20 +538,41 @@ class Agent(ABC):
         """
         Return list of capabilities based on available tools.
 
+        The list is cached until a tool is registered or unregistered,
+        so callers must treat it as read-only.
+
         Returns:
             List of AgentCapability objects
         """
-        capabilities = []
-        for tool_name, tool in self.tools.items():
-            capabilities.append(
-                AgentCapability(
-                    name=tool_name,
-                    description=getattr(tool, 'description', ''),
-                    requires_tools=[tool_name]
-                )
-            )
+        if self._capabilities_cache is not None:
+            return self._capabilities_cache
+
+        capabilities = [
+            _make_capability(tool_name, getattr(tool, 'description', ''))
+            for tool_name, tool in self.tools.items()
+        ]
+        self._capabilities_cache = capabilities
         return capabilities
 
+    @property
+    def capabilities_schema(self) -> List[Dict[str, Any]]:
+        """
+        Capabilities as plain dicts for API responses.
+
+        Built on first access and cached alongside get_capabilities(),
+        so callers must treat it as read-only.
+        """
+        if self._capabilities_schema is None:
+            self._capabilities_schema = [
+                {
+                    'name': capability.name,
+                    'description': capability.description,
+                    'requires_tools': capability.requires_tools
+                }
+                for capability in self.get_capabilities()
+            ]
+        return self._capabilities_schema
+
     def can_handle(self, task: Task) -> bool:
         """
         Determine if this agent can handle a given task.
@@ -239,12 +608,13 @@ class Agent(ABC):
             raise ValueError(f"Tool '{tool_name}' not registered with {self.name}")
 
         tool = self.tools[tool_name]
-        self.logger.debug(
-            "executing_tool",
-            agent=self.name,
-            tool=tool_name,
-            params=kwargs
-        )
+        if is_enabled_for(self.logger, logging.DEBUG):
+            self.logger.debug(
+                "executing_tool",
+                agent=self.name,
+                tool=tool_name,
+                params=kwargs
+            )
 
         result = await tool.execute(**kwargs)
         return result
@@ -257,17 +627,25 @@ class Agent(ABC):
         else:
             self.stats['tasks_failed'] += 1
         self.stats['total_execution_time_ms'] += result.execution_time_ms
+        self._stats_cache = None
 
     def get_stats(self) -> Dict[str, Any]:
-        """Get agent execution statistics"""
-        return {
-            **self.stats,
-            'success_rate': (
-                self.stats['tasks_succeeded'] / self.stats['tasks_executed']
-                if self.stats['tasks_executed'] > 0
-                else 0.0
-            )
-        }
+        """
+        Get agent execution statistics.
+
+        The returned dict is cached until the next task completes or the
+        stats are reset, so callers must treat it as read-only.
+        """
+        if self._stats_cache is None:
+            self._stats_cache = {
+                **self.stats,
+                'success_rate': (
+                    self.stats['tasks_succeeded'] / self.stats['tasks_executed']
+                    if self.stats['tasks_executed'] > 0
+                    else 0.0
+                )
+            }
+        return self._stats_cache
 
     def reset_stats(self):
         """Reset execution statistics"""
@@ -277,6 +655,7 @@ class Agent(ABC):
             'tasks_failed': 0,
             'total_execution_time_ms': 0.0
         }
+        self._stats_cache = None
 
     def __repr__(self) -> str:
         return (
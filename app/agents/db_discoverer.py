@@ -8,20 +8,33 @@ This agent is responsible for:
 - Categorizing objects by type and complexity
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
+import asyncio
+import re
+import time
 import structlog
 
 from app.agents.base import Agent, Task, AgentResult
 from app.tools.database.metadata import (
     GetDatabaseMetadataTool,
     AnalyzeDependenciesTool,
-    GetDDLTool
+    GetDDLTool,
+    GetDDLBatchTool
 )
 
 
 logger = structlog.get_logger(__name__)
 
+# Default cap on concurrent DDL batch extractions during full discovery
+DEFAULT_DDL_CONCURRENCY = 8
+
+# Object reference format: "type:schema.name"
+_OBJ_REF_RE = re.compile(r'^([^:]+):([^.]+)\.(.+)$')
+
+# Number of circular dependency groups spelled out in suggestions
+_MAX_REPORTED_CYCLES = 5
+
 
 class DBDiscovererAgent(Agent):
     """
@@ -36,6 +49,8 @@ class DBDiscovererAgent(Agent):
     6. Extract DDL for all objects
     """
 
+    __slots__ = ('_actions',)
+
     def __init__(self):
         super().__init__(
             name="db_discoverer",
@@ -43,10 +58,20 @@ class DBDiscovererAgent(Agent):
             version="1.0.0"
         )
 
+        # Supported actions -> handlers (single source of truth for
+        # execute() and can_handle())
+        self._actions = {
+            'discover_schema': self._discover_schema,
+            'analyze_dependencies': self._analyze_dependencies,
+            'get_ddl': self._get_ddl,
+            'full_discovery': self._full_discovery
+        }
+
         # Register tools
         self.register_tool(GetDatabaseMetadataTool())
         self.register_tool(AnalyzeDependenciesTool())
         self.register_tool(GetDDLTool())
+        self.register_tool(GetDDLBatchTool())
 
     async def execute(self, task: Task) -> AgentResult:
         """
@@ -64,25 +89,24 @@ class DBDiscovererAgent(Agent):
         Returns:
             AgentResult with discovery data
         """
-        start_time = datetime.utcnow()
+        start_ns = time.monotonic_ns()
         tool_calls = []
 
+        # Bind task fields once; every log line emitted while handling the
+        # task (including from helpers and tools) picks them up
+        context_tokens = structlog.contextvars.bind_contextvars(
+            task_id=task.id,
+            action=task.action
+        )
+
         try:
-            action = task.action
-            params = task.params
-
-            if action == "discover_schema":
-                result_data = await self._discover_schema(params, tool_calls)
-            elif action == "analyze_dependencies":
-                result_data = await self._analyze_dependencies(params, tool_calls)
-            elif action == "get_ddl":
-                result_data = await self._get_ddl(params, tool_calls)
-            elif action == "full_discovery":
-                result_data = await self._full_discovery(params, tool_calls)
-            else:
-                raise ValueError(f"Unknown action: {action}")
-
-            execution_time = (datetime.utcnow() - start_time).total_seconds() * 1000
+            handler = self._actions.get(task.action)
+            if handler is None:
+                raise ValueError(f"Unknown action: {task.action}")
+
+            result_data, calls = await handler(task.params)
+            tool_calls.extend(calls)
+            execution_time = (time.monotonic_ns() - start_ns) / 1e6
 
             result = AgentResult(
                 task_id=task.id,
@@ -96,12 +120,10 @@ class DBDiscovererAgent(Agent):
             return result
 
         except Exception as e:
-            execution_time = (datetime.utcnow() - start_time).total_seconds() * 1000
+            execution_time = (time.monotonic_ns() - start_ns) / 1e6
 
             self.logger.error(
                 "discovery_failed",
-                task_id=task.id,
-                action=task.action,
                 error=str(e),
                 exc_info=True
             )
@@ -117,11 +139,13 @@ class DBDiscovererAgent(Agent):
             self.update_stats(result)
             return result
 
+        finally:
+            structlog.contextvars.reset_contextvars(**context_tokens)
+
     async def _discover_schema(
         self,
-        params: Dict[str, Any],
-        tool_calls: List[str]
-    ) -> Dict[str, Any]:
+        params: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], List[str]]:
         """Discover all objects in a schema"""
         connection = params.get('connection')
         schema_name = params.get('schema_name')
@@ -133,7 +157,6 @@ class DBDiscovererAgent(Agent):
         )
 
         # Use metadata tool to get all objects
-        tool_calls.append('get_database_metadata')
         metadata_result = await self._execute_tool(
             'get_database_metadata',
             connection=connection,
@@ -161,13 +184,12 @@ class DBDiscovererAgent(Agent):
             'metadata': metadata,
             'categorized_objects': categorized_objects,
             'discovery_timestamp': datetime.utcnow().isoformat()
-        }
+        }, ['get_database_metadata']
 
     async def _analyze_dependencies(
         self,
-        params: Dict[str, Any],
-        tool_calls: List[str]
-    ) -> Dict[str, Any]:
+        params: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], List[str]]:
         """Analyze dependencies between objects"""
         connection = params.get('connection')
         schema_name = params.get('schema_name')
@@ -180,7 +202,6 @@ class DBDiscovererAgent(Agent):
         )
 
         # Use dependency analysis tool
-        tool_calls.append('analyze_dependencies')
         dep_result = await self._execute_tool(
             'analyze_dependencies',
             connection=connection,
@@ -208,13 +229,12 @@ class DBDiscovererAgent(Agent):
             'dependency_analysis': dep_data,
             'recommendations': recommendations,
             'analysis_timestamp': datetime.utcnow().isoformat()
-        }
+        }, ['analyze_dependencies']
 
     async def _get_ddl(
         self,
-        params: Dict[str, Any],
-        tool_calls: List[str]
-    ) -> Dict[str, Any]:
+        params: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], List[str]]:
         """Extract DDL for database objects"""
         connection = params.get('connection')
         schema_name = params.get('schema_name')
@@ -229,7 +249,6 @@ class DBDiscovererAgent(Agent):
         )
 
         # Use DDL extraction tool
-        tool_calls.append('get_ddl')
         ddl_result = await self._execute_tool(
             'get_ddl',
             connection=connection,
@@ -241,13 +260,12 @@ class DBDiscovererAgent(Agent):
         if not ddl_result.success:
             raise RuntimeError(f"DDL extraction failed: {ddl_result.error}")
 
-        return ddl_result.data
+        return ddl_result.data, ['get_ddl']
 
     async def _full_discovery(
         self,
-        params: Dict[str, Any],
-        tool_calls: List[str]
-    ) -> Dict[str, Any]:
+        params: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], List[str]]:
         """
         Perform full discovery: metadata + dependencies + DDL
 
@@ -263,55 +281,58 @@ class DBDiscovererAgent(Agent):
             schema_name=schema_name
         )
 
-        # Step 1: Discover schema
-        schema_discovery = await self._discover_schema(
-            {
-                'connection': connection,
-                'schema_name': schema_name,
-                'include_system_objects': include_system_objects
-            },
-            tool_calls
-        )
-
-        # Step 2: Analyze dependencies
-        dependency_analysis = await self._analyze_dependencies(
-            {
-                'connection': connection,
-                'schema_name': schema_name,
-                'object_list': None  # Analyze all objects
-            },
-            tool_calls
+        # Steps 1 & 2: Discover schema and analyze dependencies. Both only
+        # need the connection and schema name, so their round-trips overlap.
+        (schema_discovery, schema_calls), (dependency_analysis, dependency_calls) = (
+            await asyncio.gather(
+                self._discover_schema({
+                    'connection': connection,
+                    'schema_name': schema_name,
+                    'include_system_objects': include_system_objects
+                }),
+                self._analyze_dependencies({
+                    'connection': connection,
+                    'schema_name': schema_name,
+                    'object_list': None  # Analyze all objects
+                })
+            )
         )
+        tool_calls = schema_calls + dependency_calls
 
-        # Step 3: Extract DDL for all objects (using creation order)
+        # Step 3: Extract DDL for all objects. Objects are bucketed by type
+        # and schema so each bucket costs a single batched round trip, and
+        # the buckets are extracted concurrently.
         creation_order = dependency_analysis['dependency_analysis']['creation_order']
-        ddl_by_object = {}
+        extracted_ddl: Dict[str, str] = {}
+        buckets: Dict[Tuple[str, str], List[Tuple[str, str]]] = {}
 
         for obj_ref in creation_order:
-            # Parse object reference (format: "type:schema.name")
-            try:
-                obj_type, obj_full_name = obj_ref.split(':', 1)
-                schema, obj_name = obj_full_name.split('.', 1)
-
-                ddl_data = await self._get_ddl(
-                    {
-                        'connection': connection,
-                        'object_type': obj_type,
-                        'object_name': obj_name,
-                        'schema_name': schema
-                    },
-                    tool_calls
-                )
-
-                ddl_by_object[obj_ref] = ddl_data['ddl']
-
-            except Exception as e:
+            match = _OBJ_REF_RE.match(obj_ref)
+            if match is None:
                 self.logger.warning(
                     "ddl_extraction_failed_for_object",
                     object_ref=obj_ref,
-                    error=str(e)
+                    error="invalid object reference"
                 )
-                ddl_by_object[obj_ref] = f"-- Failed to extract DDL: {str(e)}"
+                extracted_ddl[obj_ref] = "-- Failed to extract DDL: invalid object reference"
+                continue
+
+            obj_type, schema, obj_name = match.groups()
+            buckets.setdefault((obj_type, schema), []).append((obj_ref, obj_name))
+
+        semaphore = asyncio.Semaphore(
+            params.get('ddl_concurrency', DEFAULT_DDL_CONCURRENCY)
+        )
+        batch_results = await asyncio.gather(*(
+            self._get_ddl_batch(connection, obj_type, schema, objects, semaphore)
+            for (obj_type, schema), objects in buckets.items()
+        ))
+        for batch_ddl in batch_results:
+            extracted_ddl.update(batch_ddl)
+        tool_calls.extend(['get_ddl_batch'] * len(buckets))
+
+        # Rebuild the mapping in creation order
+        ddl_by_object = {obj_ref: extracted_ddl[obj_ref] for obj_ref in creation_order}
 
         # Compile complete discovery report
         full_report = {
@@ -329,14 +350,72 @@ class DBDiscovererAgent(Agent):
             'discovery_timestamp': datetime.utcnow().isoformat()
         }
 
-        # Store complete report in memory
+        # Store complete report in memory. It bundles metadata, the
+        # dependency analysis and every object's DDL, so keep it compressed
+        # rather than holding the live dicts for the whole TTL.
         self.memory.cache_context(
             f"full_discovery:{schema_name}",
             full_report,
-            ttl_seconds=7200  # 2 hours
+            ttl_seconds=7200,  # 2 hours
+            compress=True
         )
 
-        return full_report
+        return full_report, tool_calls
+
+    async def _get_ddl_batch(
+        self,
+        connection: Any,
+        obj_type: str,
+        schema: str,
+        objects: List[Tuple[str, str]],
+        semaphore: asyncio.Semaphore
+    ) -> Dict[str, str]:
+        """
+        Extract DDL for one bucket of same-type objects in a schema.
+
+        Args:
+            objects: (obj_ref, obj_name) pairs belonging to the bucket
+
+        Returns:
+            Dictionary mapping each obj_ref to its DDL (or a failure comment)
+        """
+        async with semaphore:
+            try:
+                batch_result = await self._execute_tool(
+                    'get_ddl_batch',
+                    connection=connection,
+                    schema_name=schema,
+                    objects=[(obj_type, obj_name) for _, obj_name in objects]
+                )
+
+                if not batch_result.success:
+                    raise RuntimeError(f"DDL extraction failed: {batch_result.error}")
+
+                ddl_by_name = {
+                    item['object_name']: item['ddl']
+                    for item in batch_result.data['objects']
+                }
+
+            except Exception as e:
+                self.logger.warning(
+                    "ddl_batch_extraction_failed",
+                    object_type=obj_type,
+                    schema_name=schema,
+                    object_count=len(objects),
+                    error=str(e)
+                )
+                return {
+                    obj_ref: f"-- Failed to extract DDL: {str(e)}"
+                    for obj_ref, _ in objects
+                }
+
+        return {
+            obj_ref: ddl_by_name.get(
+                obj_name,
+                "-- Failed to extract DDL: not returned by batch extraction"
+            )
+            for obj_ref, obj_name in objects
+        }
 
     def _categorize_objects(self, metadata: Dict[str, Any]) -> Dict[str, List[str]]:
         """
@@ -348,44 +427,41 @@ class DBDiscovererAgent(Agent):
         - complex: Procedures with dependencies, triggers
         - very_complex: Complex procedures, circular dependencies
         """
-        categorized = {
-            'simple': [],
-            'moderate': [],
-            'complex': [],
+        # Single comprehension per bucket keeps the per-object work minimal
+        tables = metadata.get('tables', ())
+        procedures = metadata.get('procedures', ())
+
+        simple = [
+            f"TABLE:{table['name']}"
+            for table in tables if not table.get('has_foreign_keys', False)
+        ]
+        moderate = [
+            f"TABLE:{table['name']}"
+            for table in tables if table.get('has_foreign_keys', False)
+        ]
+        moderate += [f"VIEW:{view['name']}" for view in metadata.get('views', ())]
+        # Heuristic based on line count or complexity
+        complex_objects = [
+            f"PROCEDURE:{proc['name']}"
+            for proc in procedures if proc.get('line_count', 0) > 100
+        ]
+        moderate += [
+            f"PROCEDURE:{proc['name']}"
+            for proc in procedures if proc.get('line_count', 0) <= 100
+        ]
+        moderate += [f"FUNCTION:{func['name']}" for func in metadata.get('functions', ())]
+        # Triggers are usually complex
+        complex_objects += [
+            f"TRIGGER:{trigger['name']}" for trigger in metadata.get('triggers', ())
+        ]
+
+        return {
+            'simple': simple,
+            'moderate': moderate,
+            'complex': complex_objects,
             'very_complex': []
         }
 
-        # Categorize tables
-        for table in metadata.get('tables', []):
-            # Simple heuristic - can be enhanced
-            if table.get('has_foreign_keys', False):
-                categorized['moderate'].append(f"TABLE:{table['name']}")
-            else:
-                categorized['simple'].append(f"TABLE:{table['name']}")
-
-        # Categorize views
-        for view in metadata.get('views', []):
-            categorized['moderate'].append(f"VIEW:{view['name']}")
-
-        # Categorize procedures
-        for proc in metadata.get('procedures', []):
-            # Heuristic based on line count or complexity
-            lines = proc.get('line_count', 0)
-            if lines > 100:
-                categorized['complex'].append(f"PROCEDURE:{proc['name']}")
-            else:
-                categorized['moderate'].append(f"PROCEDURE:{proc['name']}")
-
-        # Categorize functions
-        for func in metadata.get('functions', []):
-            categorized['moderate'].append(f"FUNCTION:{func['name']}")
-
-        # Categorize triggers (usually complex)
-        for trigger in metadata.get('triggers', []):
-            categorized['complex'].append(f"TRIGGER:{trigger['name']}")
-
-        return categorized
-
     def _generate_migration_recommendations(
         self,
         dependency_data: Dict[str, Any]
@@ -417,6 +493,16 @@ class DBDiscovererAgent(Agent):
                 "Consider breaking circular dependencies by creating objects without "
                 "constraints first, then adding constraints in a second pass."
             )
+            cycles = dependency_data.get('circular_dependencies') or []
+            if cycles:
+                described = "; ".join(
+                    " <-> ".join(group) for group in cycles[:_MAX_REPORTED_CYCLES]
+                )
+                if len(cycles) > _MAX_REPORTED_CYCLES:
+                    described += f" (and {len(cycles) - _MAX_REPORTED_CYCLES} more)"
+                recommendations['suggestions'].append(
+                    f"Objects involved in circular dependencies: {described}"
+                )
 
         # Assess complexity based on number of objects
         total_objects = dependency_data['total_objects']
@@ -438,10 +524,4 @@ class DBDiscovererAgent(Agent):
 
     def can_handle(self, task: Task) -> bool:
         """Check if this agent can handle the task"""
-        supported_actions = {
-            'discover_schema',
-            'analyze_dependencies',
-            'get_ddl',
-            'full_discovery'
-        }
-        return task.action in supported_actions
+        return task.action in self._actions
@@ -5,11 +5,13 @@ The registry provides centralized agent management, discovery,
 and lifecycle control.
 """
 
-from typing import Dict, List, Optional, Set
-from collections import defaultdict
+from typing import Dict, Iterable, KeysView, List, Optional, Set, Tuple, ValuesView
+import logging
+import threading
 import structlog
 
 from app.agents.base import Agent, Task, AgentCapability
+from app.utils.logging import is_enabled_for
 
 
 logger = structlog.get_logger(__name__)
@@ -27,23 +29,46 @@ class AgentRegistry:
     """
 
     _instance = None
+    _lock = threading.Lock()
 
     def __new__(cls):
         """Implement singleton pattern"""
+        instance = cls._instance
+        if instance is not None:
+            return instance
+        return cls.get_instance()
+
+    def __init__(self):
+        """State is initialized once by get_instance()"""
+
+    @classmethod
+    def get_instance(cls) -> "AgentRegistry":
+        """
+        Return the registry singleton, creating it on first use.
+
+        Uses double-checked locking so only the first creation pays
+        for the lock.
+        """
         if cls._instance is None:
-            cls._instance = super(AgentRegistry, cls).__new__(cls)
-            cls._instance._initialized = False
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super(AgentRegistry, cls).__new__(cls)
+                    instance._init()
+                    cls._instance = instance
         return cls._instance
 
-    def __init__(self):
+    def _init(self):
         """Initialize the registry"""
-        if self._initialized:
-            return
-
         self.agents: Dict[str, Agent] = {}
-        self.agent_by_capability: Dict[str, Set[str]] = defaultdict(set)
+        # Plain dicts: entries are only created on the write paths, so
+        # lookups never insert empty sets for unknown capabilities
+        self.agent_by_capability: Dict[str, Set[str]] = {}
+        # Capability names each agent was indexed under at registration;
+        # unindexing uses these, since an agent's capabilities can change
+        self._indexed_capabilities: Dict[str, Tuple[str, ...]] = {}
+        # Bumped on every membership or enabled-state change
+        self._version: int = 0
         self.logger = structlog.get_logger("AgentRegistry")
-        self._initialized = True
 
     def register_agent(self, agent: Agent) -> bool:
         """
@@ -68,18 +93,24 @@ class AgentRegistry:
             )
             return False
 
+        capabilities = agent.get_capabilities()
+
         self.agents[agent.name] = agent
+        self._version += 1
 
         # Index by capabilities
-        for capability in agent.get_capabilities():
-            self.agent_by_capability[capability.name].add(agent.name)
-
-        self.logger.info(
-            "agent_registered",
-            agent_name=agent.name,
-            capabilities=len(agent.get_capabilities()),
-            tools=len(agent.tools)
-        )
+        capability_names = tuple(capability.name for capability in capabilities)
+        self._indexed_capabilities[agent.name] = capability_names
+        for capability_name in capability_names:
+            self.agent_by_capability.setdefault(capability_name, set()).add(agent.name)
+
+        if is_enabled_for(self.logger, logging.INFO):
+            self.logger.info(
+                "agent_registered",
+                agent_name=agent.name,
+                capabilities=len(capabilities),
+                tools=len(agent.tools)
+            )
 
         return True
 
@@ -100,21 +131,34 @@ class AgentRegistry:
             )
             return False
 
-        agent = self.agents[agent_name]
-
         # Remove from capability index
-        for capability in agent.get_capabilities():
-            self.agent_by_capability[capability.name].discard(agent_name)
+        for capability_name in self._indexed_capabilities.pop(agent_name):
+            self._discard_from_index(self.agent_by_capability, capability_name, agent_name)
 
         del self.agents[agent_name]
+        self._version += 1
 
-        self.logger.info(
-            "agent_unregistered",
-            agent_name=agent_name
-        )
+        if is_enabled_for(self.logger, logging.INFO):
+            self.logger.info(
+                "agent_unregistered",
+                agent_name=agent_name
+            )
 
         return True
 
+    @staticmethod
+    def _discard_from_index(
+        index: Dict[str, Set[str]],
+        capability: str,
+        agent_name: str
+    ):
+        """Remove an agent from a capability index, pruning empty entries"""
+        names = index.get(capability)
+        if names is not None:
+            names.discard(agent_name)
+            if not names:
+                del index[capability]
+
     def get_agent(self, name: str) -> Optional[Agent]:
         """
         Get an agent by name.
@@ -127,6 +171,19 @@ class AgentRegistry:
         """
         return self.agents.get(name)
 
+    def resolve_many(self, names: Iterable[str]) -> Dict[str, Optional[Agent]]:
+        """
+        Look up several agents at once.
+
+        Args:
+            names: Agent names (duplicates are resolved once)
+
+        Returns:
+            Mapping of each name to its agent, or None if not found
+        """
+        agents = self.agents
+        return {name: agents.get(name) for name in names}
+
     def list_agents(self) -> List[Agent]:
         """
         List all registered agents.
@@ -145,6 +202,24 @@ class AgentRegistry:
         """
         return list(self.agents.keys())
 
+    def iter_agents(self) -> ValuesView[Agent]:
+        """
+        Live view of all registered agents, without copying.
+
+        Returns:
+            View over agent instances (reflects later registrations)
+        """
+        return self.agents.values()
+
+    def iter_agent_names(self) -> KeysView[str]:
+        """
+        Live view of all registered agent names, without copying.
+
+        Returns:
+            View over agent names (reflects later registrations)
+        """
+        return self.agents.keys()
+
     def discover_agents(
         self,
         capability: str,
@@ -153,6 +228,9 @@ class AgentRegistry:
         """
         Discover agents that have a specific capability.
 
+        The enabled flag is read from each agent, so agents toggled by
+        assigning agent.enabled directly are handled too.
+
         Args:
             capability: Capability name to search for
             enabled_only: Only return enabled agents
@@ -160,13 +238,16 @@ class AgentRegistry:
         Returns:
             List of agents with the specified capability
         """
-        agent_names = self.agent_by_capability.get(capability, set())
-        agents = [self.agents[name] for name in agent_names if name in self.agents]
-
-        if enabled_only:
-            agents = [agent for agent in agents if agent.enabled]
-
-        return agents
+        agents = self.agents
+        if not agents:
+            return []
+        names = self.agent_by_capability.get(capability, ())
+        if not enabled_only:
+            return [agents[name] for name in names]
+        return [
+            agent for agent in map(agents.__getitem__, names)
+            if agent.enabled
+        ]
 
     def find_agent_for_task(self, task: Task) -> Optional[Agent]:
         """
@@ -178,9 +259,18 @@ class AgentRegistry:
         Returns:
             Best matching agent or None if no suitable agent found
         """
-        # First, try to find agents that can handle the task
+        # When the action names a capability, only agents indexed under it
+        # can match; otherwise fall back to asking every agent
+        names = self.agent_by_capability.get(task.action)
+        if names is not None:
+            candidates = map(self.agents.__getitem__, names)
+        else:
+            candidates = self.agents.values()
+
+        # The enabled flag is checked here rather than through an index,
+        # since it can be assigned outside the registry
         capable_agents = [
-            agent for agent in self.agents.values()
+            agent for agent in candidates
             if agent.enabled and agent.can_handle(task)
         ]
 
@@ -195,11 +285,12 @@ class AgentRegistry:
         if len(capable_agents) == 1:
             return capable_agents[0]
 
-        # Return agent with highest success rate
-        best_agent = max(
-            capable_agents,
-            key=lambda a: a.get_stats()['success_rate']
-        )
+        # Return agent with highest success rate (first candidate wins ties)
+        best_rate, best_agent = -1.0, None
+        for agent in capable_agents:
+            rate = agent.get_stats()['success_rate']
+            if rate > best_rate:
+                best_rate, best_agent = rate, agent
 
         return best_agent
 
@@ -227,8 +318,11 @@ class AgentRegistry:
         """
         agent = self.get_agent(agent_name)
         if agent:
-            agent.enabled = True
-            self.logger.info("agent_enabled", agent_name=agent_name)
+            if not agent.enabled:
+                agent.enabled = True
+                self._version += 1
+            if is_enabled_for(self.logger, logging.INFO):
+                self.logger.info("agent_enabled", agent_name=agent_name)
             return True
         return False
 
@@ -244,8 +338,11 @@ class AgentRegistry:
         """
         agent = self.get_agent(agent_name)
         if agent:
-            agent.enabled = False
-            self.logger.info("agent_disabled", agent_name=agent_name)
+            if agent.enabled:
+                agent.enabled = False
+                self._version += 1
+            if is_enabled_for(self.logger, logging.INFO):
+                self.logger.info("agent_disabled", agent_name=agent_name)
             return True
         return False
 
@@ -253,38 +350,59 @@ class AgentRegistry:
         """
         Get information about the registry.
 
+        Tools and the enabled flag can change on an agent after
+        registration, so the totals are counted here in the same pass that
+        builds the per-agent entries.
+
         Returns:
             Dictionary with registry statistics
         """
-        enabled_agents = sum(1 for agent in self.agents.values() if agent.enabled)
-        total_tools = sum(len(agent.tools) for agent in self.agents.values())
+        if not self:
+            return {
+                'total_agents': 0,
+                'enabled_agents': 0,
+                'disabled_agents': 0,
+                'total_tools': 0,
+                'capabilities': 0,
+                'agents': {}
+            }
+
+        agents_info = {}
+        total_tools = enabled_count = 0
+        for name, agent in self.agents.items():
+            n_tools = len(agent.tools)
+            total_tools += n_tools
+            enabled_count += agent.enabled
+            agents_info[name] = {
+                'enabled': agent.enabled,
+                'tools': n_tools,
+                'stats': agent.get_stats()
+            }
 
         return {
             'total_agents': len(self.agents),
-            'enabled_agents': enabled_agents,
-            'disabled_agents': len(self.agents) - enabled_agents,
+            'enabled_agents': enabled_count,
+            'disabled_agents': len(self.agents) - enabled_count,
             'total_tools': total_tools,
             'capabilities': len(self.agent_by_capability),
-            'agents': {
-                name: {
-                    'enabled': agent.enabled,
-                    'tools': len(agent.tools),
-                    'stats': agent.get_stats()
-                }
-                for name, agent in self.agents.items()
-            }
+            'agents': agents_info
         }
 
     def reset_all_stats(self):
         """Reset statistics for all agents"""
-        for agent in self.agents.values():
-            agent.reset_stats()
+        if self:
+            for agent in self.agents.values():
+                agent.reset_stats()
         self.logger.info("all_agent_stats_reset")
 
     def __len__(self) -> int:
         """Return number of registered agents"""
         return len(self.agents)
 
+    def __bool__(self) -> bool:
+        """Return True if any agent is registered"""
+        return bool(self.agents)
+
     def __contains__(self, agent_name: str) -> bool:
         """Check if an agent is registered"""
         return agent_name in self.agents
@@ -293,9 +411,9 @@ class AgentRegistry:
         return (
             f"<AgentRegistry "
             f"agents={len(self.agents)} "
-            f"enabled={sum(1 for a in self.agents.values() if a.enabled)}>"
+            f"enabled={sum(agent.enabled for agent in self.agents.values())}>"
         )
 
 
 # Global registry instance
-registry = AgentRegistry()
+registry = AgentRegistry.get_instance()
@@ -5,12 +5,35 @@ Agent management endpoints.
 from fastapi import APIRouter, HTTPException
 from typing import List, Dict, Any
 from pydantic import BaseModel
+import time
 
 from app.agents.registry import registry
 from app.agents.base import Task, AgentResult
 
 router = APIRouter()
 
+# Seconds a cached registry payload stays valid (stats may lag by this much)
+_CACHE_TTL_SECONDS = 60.0
+
+# Registry-derived payloads, keyed by the registry mutation version
+_list_cache: Dict[str, Any] = {'version': -1, 'ts': 0.0, 'payload': None}
+_info_cache: Dict[str, Any] = {'version': -1, 'ts': 0.0, 'payload': None}
+
+
+def _cached(cache: Dict[str, Any], build) -> Any:
+    """Return the cached payload, rebuilding it if stale or outdated"""
+    now = time.monotonic()
+    if (
+        cache['version'] == registry._version
+        and now - cache['ts'] < _CACHE_TTL_SECONDS
+    ):
+        return cache['payload']
+
+    cache['payload'] = build()
+    cache['version'] = registry._version
+    cache['ts'] = now
+    return cache['payload']
+
 
 class TaskRequest(BaseModel):
     """Request model for executing a task"""
@@ -33,13 +56,13 @@ class AgentInfo(BaseModel):
 @router.get("/")
 async def list_agents() -> List[str]:
     """List all registered agent names"""
-    return registry.list_agent_names()
+    return _cached(_list_cache, lambda: list(registry.iter_agent_names()))
 
 
 @router.get("/info")
 async def get_registry_info() -> Dict[str, Any]:
-    """Get comprehensive registry information"""
-    return registry.get_registry_info()
+    """Get comprehensive registry information (cached briefly)"""
+    return _cached(_info_cache, registry.get_registry_info)
 
 
 @router.get("/{agent_name}")
@@ -50,22 +73,13 @@ async def get_agent_info(agent_name: str) -> AgentInfo:
     if not agent:
         raise HTTPException(status_code=404, detail=f"Agent '{agent_name}' not found")
 
-    capabilities = [
-        {
-            "name": cap.name,
-            "description": cap.description,
-            "requires_tools": cap.requires_tools
-        }
-        for cap in agent.get_capabilities()
-    ]
-
     return AgentInfo(
         name=agent.name,
         description=agent.description,
         version=agent.version,
         enabled=agent.enabled,
         tools=list(agent.tools.keys()),
-        capabilities=capabilities,
+        capabilities=agent.capabilities_schema,
         stats=agent.get_stats()
     )
 
@@ -4,24 +4,36 @@ Health check endpoints.
 
 from fastapi import APIRouter
 from datetime import datetime
+import time
 
 router = APIRouter()
 
+# Timestamps are reported at one-second granularity, so the formatted
+# string only needs rebuilding when the second changes
+_ts_cache = {'sec': 0, 'iso': ''}
+
+_HEALTHY = {"status": "healthy"}
+_READY = {"status": "ready"}
+
+
+def _iso_now() -> str:
+    """Return the current UTC time in ISO format, cached per second"""
+    sec = int(time.time())
+    cache = _ts_cache
+    if cache['sec'] != sec:
+        cache['iso'] = datetime.utcfromtimestamp(sec).isoformat()
+        cache['sec'] = sec
+    return cache['iso']
+
 
 @router.get("/health")
 async def health_check():
     """Simple health check endpoint"""
-    return {
-        "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat()
-    }
+    return {**_HEALTHY, "timestamp": _iso_now()}
 
 
 @router.get("/ready")
 async def readiness_check():
     """Readiness check endpoint"""
     # Add checks for database connections, etc.
-    return {
-        "status": "ready",
-        "timestamp": datetime.utcnow().isoformat()
-    }
+    return {**_READY, "timestamp": _iso_now()}
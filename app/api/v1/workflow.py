@@ -46,18 +46,22 @@ class WorkflowRequest(BaseModel):
 @router.post("/create")
 async def create_workflow(request: WorkflowRequest) -> Dict[str, Any]:
     """Create a new workflow"""
-    workflow_id = str(uuid.uuid4())
+    workflow_id = uuid.uuid4().hex
 
     # Build workflow steps
+    numbers = range(1, len(request.steps) + 1)
+    step_ids = [f"step_{number}" for number in numbers]
+    task_ids = [f"task_{number}" for number in numbers]
+
     steps = []
-    for idx, step_req in enumerate(request.steps):
+    for step_id, task_id, step_req in zip(step_ids, task_ids, request.steps):
         step = WorkflowStep(
-            id=f"step_{idx + 1}",
+            id=step_id,
             name=step_req.name,
             description=step_req.description,
             agent_name=step_req.agent_name,
             task=Task(
-                id=f"task_{idx + 1}",
+                id=task_id,
                 action=step_req.action,
                 params=step_req.params
             ),
@@ -128,7 +132,8 @@ async def get_workflow_status(workflow_id: str) -> Dict[str, Any]:
             "agent": step.agent_name,
             "started_at": step.started_at.isoformat() if step.started_at else None,
             "completed_at": step.completed_at.isoformat() if step.completed_at else None,
-            "retry_count": step.retry_count
+            "retry_count": step.retry_count,
+            "duration_ms": step.duration_ms
         }
         if step.result:
             step_status["success"] = step.result.success
@@ -151,19 +156,7 @@ async def get_workflow_status(workflow_id: str) -> Dict[str, Any]:
 @router.get("/")
 async def list_workflows() -> List[Dict[str, Any]]:
     """List all workflows"""
-    workflows = workflow_engine.list_workflows()
-
-    return [
-        {
-            "workflow_id": wf.id,
-            "name": wf.name,
-            "description": wf.description,
-            "status": wf.status.value,
-            "total_steps": len(wf.steps),
-            "created_at": wf.created_at.isoformat()
-        }
-        for wf in workflows
-    ]
+    return [wf.snapshot() for wf in workflow_engine.list_workflows()]
 
 
 @router.get("/stats")
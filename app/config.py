@@ -2,14 +2,62 @@
 Configuration management for DBRefactor AI Agent.
 
 Uses pydantic-settings for environment variable management.
+
+The project's .env file is parsed once, on first use, and the result is
+shared by every config section; real environment variables still take
+precedence and os.environ is never modified.
 """
 
-from typing import Optional, List
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Mapping, Optional, List
+from dotenv import dotenv_values
 from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic_settings.sources import DotEnvSettingsSource
 from pydantic import Field
 
 
-class DatabaseConfig(BaseSettings):
+# Resolved against the project root, not the working directory
+_ENV_FILE = Path(__file__).resolve().parent.parent / ".env"
+
+
+@lru_cache(maxsize=1)
+def _dotenv_values() -> Dict[str, Optional[str]]:
+    """Parse the project's .env file (a missing file yields no values)"""
+    return dotenv_values(_ENV_FILE, encoding="utf-8")
+
+
+class _SharedDotEnvSource(DotEnvSettingsSource):
+    """Dotenv source serving the shared parse instead of re-reading the file"""
+
+    def _load_env_vars(self) -> Mapping[str, Optional[str]]:
+        values = _dotenv_values()
+        if self.case_sensitive:
+            return values
+        return {key.lower(): value for key, value in values.items()}
+
+
+class _EnvConfig(BaseSettings):
+    """Base for config sections: environment first, then the project's .env"""
+
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls,
+        init_settings,
+        env_settings,
+        dotenv_settings,
+        file_secret_settings
+    ):
+        return (
+            init_settings,
+            env_settings,
+            _SharedDotEnvSource(settings_cls),
+            file_secret_settings
+        )
+
+
+class DatabaseConfig(_EnvConfig):
     """Database connection configuration"""
 
     # Source Database (Oracle)
@@ -33,14 +81,10 @@ class DatabaseConfig(BaseSettings):
     app_db_user: str = Field(default="")
     app_db_password: str = Field(default="")
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        extra="allow"
-    )
+    model_config = SettingsConfigDict(extra="allow")
 
 
-class AIConfig(BaseSettings):
+class AIConfig(_EnvConfig):
     """AI/LLM configuration"""
 
     # Google Gemini
@@ -55,14 +99,10 @@ class AIConfig(BaseSettings):
     anthropic_api_key: Optional[str] = Field(default=None)
     anthropic_model: str = Field(default="claude-3-sonnet-20240229")
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        extra="allow"
-    )
+    model_config = SettingsConfigDict(extra="allow")
 
 
-class RedisConfig(BaseSettings):
+class RedisConfig(_EnvConfig):
     """Redis configuration for caching and task queue"""
 
     redis_host: str = Field(default="localhost")
@@ -70,14 +110,10 @@ class RedisConfig(BaseSettings):
     redis_db: int = Field(default=0)
     redis_password: Optional[str] = Field(default=None)
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        extra="allow"
-    )
+    model_config = SettingsConfigDict(extra="allow")
 
 
-class AppConfig(BaseSettings):
+class AppConfig(_EnvConfig):
     """Application configuration"""
 
     # Application
@@ -107,21 +143,35 @@ class AppConfig(BaseSettings):
     max_workflow_steps: int = Field(default=100)
     workflow_step_timeout_seconds: int = Field(default=600)
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        extra="allow"
-    )
+    model_config = SettingsConfigDict(extra="allow")
 
 
 class Settings:
-    """Combined settings"""
-
-    def __init__(self):
-        self.app = AppConfig()
-        self.database = DatabaseConfig()
-        self.ai = AIConfig()
-        self.redis = RedisConfig()
+    """
+    Combined settings.
+
+    Each config section is built on first access and then stored as a
+    plain instance attribute, so sections a process never reads are
+    never validated.
+    """
+
+    _factories = {
+        'app': AppConfig,
+        'database': DatabaseConfig,
+        'ai': AIConfig,
+        'redis': RedisConfig
+    }
+
+    def __getattr__(self, name: str):
+        # Only called when normal lookup fails, i.e. on first access
+        factory = self._factories.get(name)
+        if factory is None:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        config = factory()
+        setattr(self, name, config)
+        return config
 
 
 # Global settings instance
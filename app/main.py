@@ -8,48 +8,116 @@ middleware, and WebSocket support.
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse, Response
 from contextlib import asynccontextmanager
 import structlog
-from typing import List
-import json
+from typing import Any, Awaitable, Callable, Dict, Set
+import asyncio
+import orjson
 import os
 
 from app.config import settings
 from app.agents.registry import registry
 from app.agents.db_discoverer import DBDiscovererAgent
 from app.workflow.engine import WorkflowEngine
+from app.api.v1 import agents, discovery, workflow, health
 
 logger = structlog.get_logger(__name__)
 
+# Inbound WebSocket messages larger than this are rejected unparsed
+MAX_WS_MSG_BYTES = 64 * 1024
+
 
 # WebSocket connection manager
 class ConnectionManager:
+    __slots__ = ('active_connections',)
+
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Set[WebSocket] = set()
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
         logger.info("websocket_connected", total_connections=len(self.active_connections))
 
     def disconnect(self, websocket: WebSocket):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        self.active_connections.discard(websocket)
         logger.info("websocket_disconnected", total_connections=len(self.active_connections))
 
     async def broadcast(self, message: dict):
-        """Broadcast message to all connected clients"""
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.error("broadcast_failed", error=str(e))
+        """
+        Broadcast message to all connected clients.
+
+        The message is serialized once and sent to every client
+        concurrently; clients whose send fails are disconnected.
+        """
+        payload = orjson.dumps(message).decode()
+        # Snapshot: disconnects may mutate the set while sends are pending
+        connections = tuple(self.active_connections)
+        results = await asyncio.gather(
+            *(connection.send_text(payload) for connection in connections),
+            return_exceptions=True
+        )
+
+        failed = []
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception):
+                logger.error("broadcast_failed", error=str(result))
+                failed.append(connection)
+
+        # Prune dead clients in one pass
+        if failed:
+            self.active_connections.difference_update(failed)
+            logger.info(
+                "websocket_disconnected",
+                total_connections=len(self.active_connections),
+                pruned=len(failed)
+            )
 
 
 manager = ConnectionManager()
 
 
+class CachedStaticFiles(StaticFiles):
+    """Static files served with long-lived cache headers"""
+
+    def file_response(self, *args, **kwargs):
+        # Vite asset filenames are content-hashed, so they never change
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
+
+async def _send_json(websocket: WebSocket, message: dict):
+    """Send a message as a JSON text frame, encoded with orjson"""
+    await websocket.send_text(orjson.dumps(message).decode())
+
+
+# Constant replies are serialized once
+_PONG = orjson.dumps({"type": "pong"}).decode()
+_ERR_INVALID_JSON = orjson.dumps({"type": "error", "message": "Invalid JSON format"}).decode()
+_ERR_TOO_LARGE = orjson.dumps({"type": "error", "message": "Payload too large"}).decode()
+
+
+async def _handle_ping(websocket: WebSocket, message: Dict[str, Any]):
+    await websocket.send_text(_PONG)
+
+
+async def _handle_subscribe(websocket: WebSocket, message: Dict[str, Any]):
+    # Client subscribes to specific events
+    await _send_json(websocket, {
+        "type": "subscribed",
+        "channel": message.get("channel")
+    })
+
+
+# WebSocket message type -> handler
+_WS_HANDLERS: Dict[str, Callable[[WebSocket, Dict[str, Any]], Awaitable[None]]] = {
+    "ping": _handle_ping,
+    "subscribe": _handle_subscribe
+}
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events"""
@@ -76,7 +144,9 @@ app = FastAPI(
     title=settings.app.app_name,
     version=settings.app.app_version,
     description="Agentic framework for database migration",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # orjson serializes the dict-heavy registry/workflow payloads faster
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -88,14 +158,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Import routers
-from app.api.v1 import agents, discovery, workflow, health
-
 # Include routers
-app.include_router(health.router, prefix=f"{settings.app.api_prefix}", tags=["health"])
-app.include_router(agents.router, prefix=f"{settings.app.api_prefix}/agents", tags=["agents"])
-app.include_router(discovery.router, prefix=f"{settings.app.api_prefix}/discovery", tags=["discovery"])
-app.include_router(workflow.router, prefix=f"{settings.app.api_prefix}/workflows", tags=["workflows"])
+_API = settings.app.api_prefix
+for module, suffix, tag in (
+    (health, "", "health"),
+    (agents, "/agents", "agents"),
+    (discovery, "/discovery", "discovery"),
+    (workflow, "/workflows", "workflows"),
+):
+    app.include_router(module.router, prefix=f"{_API}{suffix}", tags=[tag])
 
 
 @app.websocket("/ws")
@@ -104,28 +175,29 @@ async def websocket_endpoint(websocket: WebSocket):
     await manager.connect(websocket)
     try:
         while True:
-            # Receive messages from client
-            data = await websocket.receive_text()
+            # Receive messages from client (text or binary frames)
+            frame = await websocket.receive()
+            if frame["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(frame.get("code", 1000))
+            data = frame.get("bytes") or frame.get("text") or ""
+
+            # Text frames are measured in characters, a cheap lower bound
+            if len(data) > MAX_WS_MSG_BYTES:
+                logger.warning("websocket_message_too_large", size=len(data))
+                await websocket.send_text(_ERR_TOO_LARGE)
+                continue
 
             try:
-                message = json.loads(data)
-            except json.JSONDecodeError as e:
+                message = orjson.loads(data)
+            except orjson.JSONDecodeError as e:
                 logger.warning("invalid_json_received", error=str(e), data=data[:100])
-                await websocket.send_json({
-                    "type": "error",
-                    "message": "Invalid JSON format"
-                })
+                await websocket.send_text(_ERR_INVALID_JSON)
                 continue
 
-            # Handle different message types
-            if message.get("type") == "ping":
-                await websocket.send_json({"type": "pong"})
-            elif message.get("type") == "subscribe":
-                # Client subscribes to specific events
-                await websocket.send_json({
-                    "type": "subscribed",
-                    "channel": message.get("channel")
-                })
+            # Dispatch on message type; unknown types are ignored
+            handler = _WS_HANDLERS.get(message.get("type"))
+            if handler is not None:
+                await handler(websocket, message)
 
     except WebSocketDisconnect:
         manager.disconnect(websocket)
@@ -142,12 +214,39 @@ ui_dist_path = os.environ.get(
 )
 
 if os.path.exists(ui_dist_path):
-    app.mount("/assets", StaticFiles(directory=os.path.join(ui_dist_path, "assets")), name="assets")
+    _INDEX_HTML = os.path.join(ui_dist_path, "index.html")
+    _ASSETS_DIR = os.path.join(ui_dist_path, "assets")
+
+    app.mount(
+        "/assets",
+        CachedStaticFiles(directory=_ASSETS_DIR),
+        name="assets"
+    )
+
+    # The UI build is immutable for the process lifetime: map each file's
+    # URL path to its absolute path and read index.html once, instead of
+    # hitting the filesystem per request
+    UI_FILES: Dict[str, str] = {}
+    for root, _, filenames in os.walk(ui_dist_path):
+        for filename in filenames:
+            file_path = os.path.join(root, filename)
+            url_path = os.path.relpath(file_path, ui_dist_path).replace(os.sep, "/")
+            UI_FILES[url_path] = file_path
+
+    with open(_INDEX_HTML, "rb") as index_file:
+        _index_bytes = index_file.read()
+
+    def _index_response() -> Response:
+        return Response(
+            content=_index_bytes,
+            media_type="text/html",
+            headers={"Cache-Control": "no-cache"}
+        )
 
     @app.get("/")
     async def serve_ui():
         """Serve the React UI"""
-        return FileResponse(os.path.join(ui_dist_path, "index.html"))
+        return _index_response()
 
     @app.get("/{full_path:path}")
     async def catch_all(full_path: str):
@@ -156,11 +255,11 @@ if os.path.exists(ui_dist_path):
         if full_path.startswith("api") or full_path.startswith("/api") or full_path.startswith("ws"):
             return {"error": "Not found"}
 
-        file_path = os.path.join(ui_dist_path, full_path)
-        if os.path.exists(file_path) and os.path.isfile(file_path):
+        file_path = UI_FILES.get(full_path)
+        if file_path is not None:
             return FileResponse(file_path)
 
-        return FileResponse(os.path.join(ui_dist_path, "index.html"))
+        return _index_response()
 else:
     logger.warning("ui_dist_not_found", path=ui_dist_path)
 
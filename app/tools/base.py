@@ -6,16 +6,31 @@ and perform various operations.
 """
 
 from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass
 from typing import Any, Dict, Optional, List
 from enum import Enum
-from datetime import datetime
 from pydantic import BaseModel, Field
+import orjson
+import re
 import structlog
+import time
 
 
 logger = structlog.get_logger(__name__)
 
 
+# Python classes for ToolParameter.type names; unknown types are not checked
+_TYPE_MAP: Dict[str, type] = {
+    'str': str,
+    'int': int,
+    'float': float,
+    'bool': bool,
+    'dict': dict,
+    'list': list,
+    'any': object
+}
+
+
 class ToolCategory(str, Enum):
     """Categories of tools available in the system"""
     DATABASE = "database"
@@ -39,7 +54,12 @@ class ToolParameter(BaseModel):
 
 
 class ToolResult(BaseModel):
-    """Result of a tool execution"""
+    """
+    Result of a tool execution.
+
+    Tools build results from trusted internal values, so they use
+    ToolResult.model_construct() to skip validation on the hot path.
+    """
     success: bool
     data: Optional[Any] = None
     error: Optional[str] = None
@@ -47,6 +67,15 @@ class ToolResult(BaseModel):
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
 
+@dataclass(slots=True)
+class _ToolStats:
+    """Execution counters for a tool"""
+    executions: int = 0
+    successes: int = 0
+    failures: int = 0
+    total_execution_time_ms: float = 0.0
+
+
 class Tool(ABC):
     """
     Base class for all tools in the DBRefactor AI framework.
@@ -77,13 +106,35 @@ class Tool(ABC):
         self.parameters = parameters or []
         self.logger = structlog.get_logger(f"Tool.{name}")
 
-        # Execution statistics
-        self.stats = {
-            'executions': 0,
-            'successes': 0,
-            'failures': 0,
-            'total_execution_time_ms': 0.0
+        # Validation lookups, derived once from the fixed parameter list
+        self._required_params = frozenset(
+            p.name for p in self.parameters if p.required
+        )
+        self._param_by_name: Dict[str, ToolParameter] = {
+            p.name: p for p in self.parameters
+        }
+        self._expected_types: Dict[str, type] = {
+            p.name: _TYPE_MAP.get(p.type.lower(), object)
+            for p in self.parameters
         }
+        self._patterns: Dict[str, re.Pattern] = {
+            p.name: re.compile(p.validation_rules['pattern'])
+            for p in self.parameters
+            if 'pattern' in p.validation_rules
+        }
+        # False when no call could fail validation (nothing required,
+        # no rules and only unchecked types)
+        self._has_validation = bool(self._required_params) or any(
+            p.validation_rules or self._expected_types[p.name] is not object
+            for p in self.parameters
+        )
+
+        # Parameter schema, built on first request
+        self._parameter_schema: Optional[Dict[str, Any]] = None
+        self._parameter_schema_json: Optional[bytes] = None
+
+        # Execution statistics
+        self.stats = _ToolStats()
 
     @abstractmethod
     async def execute(self, **kwargs) -> ToolResult:
@@ -111,59 +162,42 @@ class Tool(ABC):
         Returns:
             Tuple of (is_valid, error_message)
         """
-        # Check required parameters
-        required_params = {p.name for p in self.parameters if p.required}
-        provided_params = set(kwargs.keys())
+        if not self._has_validation:
+            return True, None
 
-        missing_params = required_params - provided_params
+        # Check required parameters
+        missing_params = self._required_params.difference(kwargs)
         if missing_params:
-            return False, f"Missing required parameters: {missing_params}"
+            return False, f"Missing required parameters: {set(missing_params)}"
+
+        # Check parameter types (unknown kwargs are not validated)
+        param_by_name = self._param_by_name
+        expected_types = self._expected_types
+        for name, value in kwargs.items():
+            param = param_by_name.get(name)
+            if param is None:
+                continue
+
+            # Basic type validation
+            if not isinstance(value, expected_types[name]):
+                return (
+                    False,
+                    f"Parameter '{param.name}' expected type '{param.type}', "
+                    f"got '{type(value).__name__}'"
+                )
 
-        # Check parameter types
-        for param in self.parameters:
-            if param.name in kwargs:
-                value = kwargs[param.name]
-                expected_type = param.type
-
-                # Basic type validation
-                if not self._validate_type(value, expected_type):
-                    return (
-                        False,
-                        f"Parameter '{param.name}' expected type '{expected_type}', "
-                        f"got '{type(value).__name__}'"
-                    )
-
-                # Apply validation rules
-                if param.validation_rules:
-                    is_valid, error = self._apply_validation_rules(
-                        param.name,
-                        value,
-                        param.validation_rules
-                    )
-                    if not is_valid:
-                        return False, error
+            # Apply validation rules
+            if param.validation_rules:
+                is_valid, error = self._apply_validation_rules(
+                    param.name,
+                    value,
+                    param.validation_rules
+                )
+                if not is_valid:
+                    return False, error
 
         return True, None
 
-    def _validate_type(self, value: Any, expected_type: str) -> bool:
-        """Validate that value matches expected type"""
-        type_mapping = {
-            'str': str,
-            'int': int,
-            'float': float,
-            'bool': bool,
-            'dict': dict,
-            'list': list,
-            'any': object
-        }
-
-        expected_class = type_mapping.get(expected_type.lower())
-        if expected_class is None:
-            # Unknown type, skip validation
-            return True
-
-        return isinstance(value, expected_class)
-
     def _apply_validation_rules(
         self,
         param_name: str,
@@ -205,8 +239,8 @@ class Tool(ABC):
 
         # Pattern validation for strings
         if 'pattern' in rules and isinstance(value, str):
-            import re
-            if not re.match(rules['pattern'], value):
+            pattern = self._patterns.get(param_name) or re.compile(rules['pattern'])
+            if not pattern.match(value):
                 return (
                     False,
                     f"Parameter '{param_name}' does not match pattern {rules['pattern']}"
@@ -227,14 +261,13 @@ class Tool(ABC):
         Returns:
             ToolResult
         """
-        start_time = datetime.utcnow()
+        start_ns = time.perf_counter_ns()
 
         # Validate parameters
         is_valid, error_msg = self.validate_parameters(**kwargs)
         if not is_valid:
-            self.stats['executions'] += 1
-            self.stats['failures'] += 1
-            return ToolResult(
+            self._record_execution(False)
+            return ToolResult.model_construct(
                 success=False,
                 error=error_msg,
                 execution_time_ms=0.0
@@ -245,25 +278,16 @@ class Tool(ABC):
             result = await self.execute(**kwargs)
 
             # Update statistics
-            execution_time = (datetime.utcnow() - start_time).total_seconds() * 1000
+            execution_time = (time.perf_counter_ns() - start_ns) / 1_000_000
             result.execution_time_ms = execution_time
-
-            self.stats['executions'] += 1
-            if result.success:
-                self.stats['successes'] += 1
-            else:
-                self.stats['failures'] += 1
-            self.stats['total_execution_time_ms'] += execution_time
+            self._record_execution(result.success, execution_time)
 
             return result
 
         except Exception as e:
             # Handle unexpected errors
-            execution_time = (datetime.utcnow() - start_time).total_seconds() * 1000
-
-            self.stats['executions'] += 1
-            self.stats['failures'] += 1
-            self.stats['total_execution_time_ms'] += execution_time
+            execution_time = (time.perf_counter_ns() - start_ns) / 1_000_000
+            self._record_execution(False, execution_time)
 
             self.logger.error(
                 "tool_execution_failed",
@@ -272,19 +296,35 @@ class Tool(ABC):
                 exc_info=True
             )
 
-            return ToolResult(
+            return ToolResult.model_construct(
                 success=False,
                 error=f"Tool execution failed: {str(e)}",
                 execution_time_ms=execution_time
             )
 
+    def _record_execution(self, success: bool, execution_time_ms: float = 0.0):
+        """Update execution statistics for one call"""
+        stats = self.stats
+        stats.executions += 1
+        if success:
+            stats.successes += 1
+        else:
+            stats.failures += 1
+        stats.total_execution_time_ms += execution_time_ms
+
     def get_parameter_schema(self) -> Dict[str, Any]:
         """
         Get JSON schema for tool parameters.
 
+        Parameters are fixed at construction, so the schema is built once
+        and cached; callers must treat it as read-only.
+
         Returns:
             Dictionary containing parameter schema
         """
+        if self._parameter_schema is not None:
+            return self._parameter_schema
+
         properties = {}
         required = []
 
@@ -305,36 +345,44 @@ class Tool(ABC):
             if param.required:
                 required.append(param.name)
 
-        return {
+        self._parameter_schema = {
             'type': 'object',
             'properties': properties,
             'required': required
         }
+        return self._parameter_schema
+
+    def get_parameter_schema_json(self) -> bytes:
+        """
+        Get the parameter schema serialized as JSON.
+
+        Returns:
+            orjson-encoded schema, cached alongside get_parameter_schema()
+        """
+        if self._parameter_schema_json is None:
+            self._parameter_schema_json = orjson.dumps(self.get_parameter_schema())
+        return self._parameter_schema_json
 
     def get_stats(self) -> Dict[str, Any]:
         """Get tool execution statistics"""
+        stats = self.stats
         return {
-            **self.stats,
+            **asdict(stats),
             'success_rate': (
-                self.stats['successes'] / self.stats['executions']
-                if self.stats['executions'] > 0
+                stats.successes / stats.executions
+                if stats.executions > 0
                 else 0.0
             ),
             'average_execution_time_ms': (
-                self.stats['total_execution_time_ms'] / self.stats['executions']
-                if self.stats['executions'] > 0
+                stats.total_execution_time_ms / stats.executions
+                if stats.executions > 0
                 else 0.0
             )
         }
 
     def reset_stats(self):
         """Reset execution statistics"""
-        self.stats = {
-            'executions': 0,
-            'successes': 0,
-            'failures': 0,
-            'total_execution_time_ms': 0.0
-        }
+        self.stats = _ToolStats()
 
     def __repr__(self) -> str:
         return (
@@ -5,14 +5,69 @@ These tools help discover database objects, extract DDL,
 and analyze schema structure.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+from collections import deque
+from dataclasses import dataclass
+import asyncio
 from app.tools.base import Tool, ToolCategory, ToolParameter, ToolResult
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
 import structlog
 
 
 logger = structlog.get_logger(__name__)
 
 
+@dataclass(slots=True)
+class _GraphArrays:
+    """Integer form of a dependency graph, shared by the sort and cycle passes"""
+    nodes: List[str]
+    sources: np.ndarray
+    targets: np.ndarray
+    n_components: int
+    labels: np.ndarray
+
+
+def _graph_arrays(graph: Dict[str, Any]) -> _GraphArrays:
+    """
+    Convert a dependency graph to integer edge arrays and label its
+    strongly connected components.
+
+    Nodes are taken from graph['nodes'] (plus any edge endpoint not listed
+    there) and edges from graph['edges'] as (source, target) pairs, where
+    the source depends on the target.
+
+    Returns:
+        _GraphArrays with node names, edge indices and component labels
+    """
+    index: Dict[str, int] = {name: i for i, name in enumerate(graph.get('nodes', {}))}
+    edges = graph.get('edges', [])
+    for source, target in edges:
+        index.setdefault(source, len(index))
+        index.setdefault(target, len(index))
+
+    sources = np.fromiter((index[s] for s, _ in edges), dtype=np.int32, count=len(edges))
+    targets = np.fromiter((index[t] for _, t in edges), dtype=np.int32, count=len(edges))
+
+    n_nodes = len(index)
+    if len(edges):
+        adjacency = csr_matrix(
+            (np.ones(len(edges), dtype=np.int8), (sources, targets)),
+            shape=(n_nodes, n_nodes)
+        )
+        n_components, labels = connected_components(
+            adjacency,
+            directed=True,
+            connection='strong'
+        )
+    else:
+        # Without edges every object is its own component
+        n_components, labels = n_nodes, np.arange(n_nodes, dtype=np.int32)
+
+    return _GraphArrays(list(index), sources, targets, n_components, labels)
+
+
 class GetDatabaseMetadataTool(Tool):
     """Tool for extracting comprehensive database metadata"""
 
@@ -51,35 +106,47 @@ class GetDatabaseMetadataTool(Tool):
         include_system = kwargs.get('include_system_objects', False)
 
         try:
+            # The catalog queries are independent, so run them concurrently
+            # (drivers without pipelining need a pooled connection per query)
+            tables, views, procedures, functions, triggers, sequences = await asyncio.gather(
+                self._get_tables(connection, schema_name, include_system),
+                self._get_views(connection, schema_name, include_system),
+                self._get_procedures(connection, schema_name, include_system),
+                self._get_functions(connection, schema_name, include_system),
+                self._get_triggers(connection, schema_name, include_system),
+                self._get_sequences(connection, schema_name, include_system)
+            )
+
             metadata = {
                 'schema_name': schema_name,
-                'tables': await self._get_tables(connection, schema_name, include_system),
-                'views': await self._get_views(connection, schema_name, include_system),
-                'procedures': await self._get_procedures(connection, schema_name, include_system),
-                'functions': await self._get_functions(connection, schema_name, include_system),
-                'triggers': await self._get_triggers(connection, schema_name, include_system),
-                'sequences': await self._get_sequences(connection, schema_name, include_system)
+                'tables': tables,
+                'views': views,
+                'procedures': procedures,
+                'functions': functions,
+                'triggers': triggers,
+                'sequences': sequences
             }
 
             # Calculate summary statistics
+            counts = (
+                len(tables),
+                len(views),
+                len(procedures),
+                len(functions),
+                len(triggers),
+                len(sequences)
+            )
             metadata['summary'] = {
-                'total_tables': len(metadata['tables']),
-                'total_views': len(metadata['views']),
-                'total_procedures': len(metadata['procedures']),
-                'total_functions': len(metadata['functions']),
-                'total_triggers': len(metadata['triggers']),
-                'total_sequences': len(metadata['sequences']),
-                'total_objects': sum([
-                    len(metadata['tables']),
-                    len(metadata['views']),
-                    len(metadata['procedures']),
-                    len(metadata['functions']),
-                    len(metadata['triggers']),
-                    len(metadata['sequences'])
-                ])
+                'total_tables': counts[0],
+                'total_views': counts[1],
+                'total_procedures': counts[2],
+                'total_functions': counts[3],
+                'total_triggers': counts[4],
+                'total_sequences': counts[5],
+                'total_objects': sum(counts)
             }
 
-            return ToolResult(
+            return ToolResult.model_construct(
                 success=True,
                 data=metadata,
                 execution_time_ms=0.0  # Will be set by _safe_execute
@@ -87,7 +154,7 @@ class GetDatabaseMetadataTool(Tool):
 
         except Exception as e:
             self.logger.error("metadata_extraction_failed", error=str(e))
-            return ToolResult(
+            return ToolResult.model_construct(
                 success=False,
                 error=f"Failed to extract metadata: {str(e)}",
                 execution_time_ms=0.0
@@ -195,22 +262,25 @@ class AnalyzeDependenciesTool(Tool):
                 object_list
             )
 
-            # Perform topological sort to get creation order
-            creation_order = self._topological_sort(dependency_graph)
+            # Both passes share one array build and SCC labelling
+            arrays = _graph_arrays(dependency_graph)
 
-            # Detect circular dependencies
-            circular_deps = self._detect_circular_dependencies(dependency_graph)
+            # Perform topological sort to get creation order
+            creation_order = self._topological_sort(arrays)
+            circular_deps = self._detect_circular_dependencies(arrays)
 
             result = {
                 'dependency_graph': dependency_graph,
                 'creation_order': creation_order,
                 'circular_dependencies': circular_deps,
                 'has_circular_dependencies': len(circular_deps) > 0,
-                'total_objects': len(dependency_graph.get('nodes', {})),
+                # Counted from the same node set as creation_order, which also
+                # includes objects that only appear as edge endpoints
+                'total_objects': len(arrays.nodes),
                 'total_dependencies': len(dependency_graph.get('edges', []))
             }
 
-            return ToolResult(
+            return ToolResult.model_construct(
                 success=True,
                 data=result,
                 execution_time_ms=0.0
@@ -218,7 +288,7 @@ class AnalyzeDependenciesTool(Tool):
 
         except Exception as e:
             self.logger.error("dependency_analysis_failed", error=str(e))
-            return ToolResult(
+            return ToolResult.model_construct(
                 success=False,
                 error=f"Failed to analyze dependencies: {str(e)}",
                 execution_time_ms=0.0
@@ -238,19 +308,87 @@ class AnalyzeDependenciesTool(Tool):
             'edges': []
         }
 
-    def _topological_sort(self, graph: Dict[str, Any]) -> List[str]:
-        """Perform topological sort on dependency graph"""
-        # Placeholder - actual implementation would use Kahn's algorithm
-        # or DFS-based topological sort
-        return []
+    def _topological_sort(self, arrays: _GraphArrays) -> List[str]:
+        """
+        Perform topological sort on dependency graph.
+
+        Uses Kahn's algorithm over a CSR adjacency (dependency -> dependents)
+        of the strongly connected components, so every object comes after
+        the objects it depends on. Mutually dependent objects cannot be
+        ordered among themselves; they are emitted together once everything
+        their cycle depends on has been placed, so no object is dropped.
+        """
+        nodes, labels = arrays.nodes, arrays.labels
+        n_nodes, n_comps = len(nodes), arrays.n_components
+        if not len(arrays.sources):
+            return nodes
+
+        # Edges between components; edges inside a cycle do not constrain it
+        comp_sources = labels[arrays.sources]
+        comp_targets = labels[arrays.targets]
+        crossing = comp_sources != comp_targets
+        comp_sources = comp_sources[crossing]
+        comp_targets = comp_targets[crossing]
+
+        # CSR rows are dependencies; each row lists the components needing it
+        indptr = np.zeros(n_comps + 1, dtype=np.int64)
+        np.cumsum(np.bincount(comp_targets, minlength=n_comps), out=indptr[1:])
+        indices = comp_sources[np.argsort(comp_targets, kind='stable')]
+
+        # Component members in node order; components are seeded by their
+        # first node so acyclic graphs keep the node ordering
+        by_label = np.argsort(labels, kind='stable')
+        members_indptr = np.zeros(n_comps + 1, dtype=np.int64)
+        np.cumsum(np.bincount(labels, minlength=n_comps), out=members_indptr[1:])
+        first_node = by_label[members_indptr[:-1]]
+
+        indegree = np.bincount(comp_sources, minlength=n_comps).tolist()
+        indptr_list = indptr.tolist()
+        indices_list = indices.tolist()
+        by_label_list = by_label.tolist()
+        members_list = members_indptr.tolist()
+
+        ready = deque(
+            comp for comp in np.argsort(first_node, kind='stable').tolist()
+            if indegree[comp] == 0
+        )
+        order: List[str] = []
+        while ready:
+            comp = ready.popleft()
+            order.extend(
+                nodes[node]
+                for node in by_label_list[members_list[comp]:members_list[comp + 1]]
+            )
+            for dependent in indices_list[indptr_list[comp]:indptr_list[comp + 1]]:
+                indegree[dependent] -= 1
+                if indegree[dependent] == 0:
+                    ready.append(dependent)
+
+        return order
 
     def _detect_circular_dependencies(
         self,
-        graph: Dict[str, Any]
+        arrays: _GraphArrays
     ) -> List[List[str]]:
-        """Detect circular dependencies in the graph"""
-        # Placeholder - actual implementation would use cycle detection algorithm
-        return []
+        """
+        Detect circular dependencies in the graph.
+
+        Every strongly connected component with more than one object is a
+        group of mutually dependent objects; a self-referencing object is a
+        group of one.
+        """
+        nodes, sources, targets = arrays.nodes, arrays.sources, arrays.targets
+        if not len(sources):
+            return []
+
+        n_components, labels = arrays.n_components, arrays.labels
+        cyclic = np.bincount(labels, minlength=n_components) > 1
+        cyclic[labels[sources[sources == targets]]] = True
+
+        groups: Dict[int, List[str]] = {}
+        for node_index in np.flatnonzero(cyclic[labels]):
+            groups.setdefault(int(labels[node_index]), []).append(nodes[node_index])
+        return list(groups.values())
 
 
 class GetDDLTool(Tool):
@@ -304,7 +442,7 @@ class GetDDLTool(Tool):
                 schema_name
             )
 
-            return ToolResult(
+            return ToolResult.model_construct(
                 success=True,
                 data={
                     'object_type': object_type,
@@ -317,7 +455,7 @@ class GetDDLTool(Tool):
 
         except Exception as e:
             self.logger.error("ddl_extraction_failed", error=str(e))
-            return ToolResult(
+            return ToolResult.model_construct(
                 success=False,
                 error=f"Failed to extract DDL: {str(e)}",
                 execution_time_ms=0.0
@@ -334,3 +472,83 @@ class GetDDLTool(Tool):
         # Placeholder - actual implementation would use database-specific
         # DDL extraction methods (e.g., DBMS_METADATA.GET_DDL for Oracle)
         return f"-- DDL for {schema_name}.{object_name} ({object_type})"
+
+
+class GetDDLBatchTool(Tool):
+    """Tool for extracting DDL for many database objects in one round trip"""
+
+    def __init__(self):
+        super().__init__(
+            name="get_ddl_batch",
+            description="Extract DDL for multiple database objects with a single grouped query",
+            category=ToolCategory.DATABASE,
+            parameters=[
+                ToolParameter(
+                    name="connection",
+                    description="Database connection object",
+                    type="any",
+                    required=True
+                ),
+                ToolParameter(
+                    name="schema_name",
+                    description="Schema name",
+                    type="str",
+                    required=True
+                ),
+                ToolParameter(
+                    name="objects",
+                    description="List of (object_type, object_name) pairs to extract",
+                    type="list",
+                    required=True
+                )
+            ]
+        )
+
+    async def execute(self, **kwargs) -> ToolResult:
+        """Execute batched DDL extraction"""
+        connection = kwargs.get('connection')
+        schema_name = kwargs.get('schema_name')
+        objects = kwargs.get('objects') or []
+
+        try:
+            ddl_objects = await self._extract_ddl_batch(
+                connection,
+                schema_name,
+                objects
+            )
+
+            return ToolResult.model_construct(
+                success=True,
+                data={
+                    'schema_name': schema_name,
+                    'objects': ddl_objects
+                },
+                execution_time_ms=0.0
+            )
+
+        except Exception as e:
+            self.logger.error("ddl_batch_extraction_failed", error=str(e))
+            return ToolResult.model_construct(
+                success=False,
+                error=f"Failed to extract DDL: {str(e)}",
+                execution_time_ms=0.0
+            )
+
+    async def _extract_ddl_batch(
+        self,
+        connection: Any,
+        schema_name: str,
+        objects: List[Any]
+    ) -> List[Dict[str, Any]]:
+        """Extract DDL for all requested objects using one grouped query"""
+        # Placeholder - actual implementation would issue a single query for
+        # the whole batch (e.g., DBMS_METADATA.GET_DDL over an IN-list for
+        # Oracle, or pg_get_*def over a VALUES list for PostgreSQL)
+        return [
+            {
+                'object_type': object_type,
+                'object_name': object_name,
+                'ddl': f"-- DDL for {schema_name}.{object_name} ({object_type})"
+            }
+            for object_type, object_name in objects
+        ]
@@ -2,12 +2,18 @@
 Logging configuration for DBRefactor AI Agent.
 """
 
+import orjson
 import structlog
 import logging
 import sys
 from typing import Any
 
 
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """JSONRenderer serializer; kwargs carry structlog's 'default' fallback"""
+    return orjson.dumps(obj, **kwargs).decode()
+
+
 def configure_logging(log_level: str = "INFO", log_format: str = "json") -> None:
     """
     Configure structured logging for the application.
@@ -34,7 +40,7 @@ def configure_logging(log_level: str = "INFO", log_format: str = "json") -> None
     ]
 
     if log_format == "json":
-        processors.append(structlog.processors.JSONRenderer())
+        processors.append(structlog.processors.JSONRenderer(serializer=_orjson_dumps))
     else:
         processors.append(structlog.dev.ConsoleRenderer())
 
@@ -58,3 +64,24 @@ def get_logger(name: str) -> Any:
         Structured logger instance
     """
     return structlog.get_logger(name)
+
+
+def is_enabled_for(logger: Any, level: int) -> bool:
+    """
+    Check whether a structured logger would emit at the given level.
+
+    Lets hot paths skip building log kwargs for disabled levels.
+
+    Args:
+        logger: Structured logger instance
+        level: Standard logging level (e.g. logging.DEBUG)
+
+    Returns:
+        True if the level is enabled (or cannot be determined)
+    """
+    is_enabled = getattr(logger, 'isEnabledFor', None)
+    if is_enabled is None:
+        # structlog's default filtering loggers expose no level query;
+        # they drop disabled levels themselves
+        return True
+    return is_enabled(level)
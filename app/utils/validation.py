@@ -6,6 +6,16 @@ from typing import List, Optional
 import re
 
 
+# Basic hostname/IP patterns, compiled once
+_HOSTNAME_RE = re.compile(r'^[a-zA-Z0-9]([a-zA-Z0-9\-\.]{0,61}[a-zA-Z0-9])?$')
+_IP_RE = re.compile(r'^(\d{1,3}\.){3}\d{1,3}$')
+
+# Hosts accepted without pattern matching
+_LOCAL_HOSTS = frozenset({'localhost', '0.0.0.0', '127.0.0.1'})
+
+_VALID_LOG_LEVELS = frozenset({'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'})
+
+
 def validate_required_env_vars(required_vars: List[str], settings: dict) -> List[str]:
     """
     Validate that required environment variables are set.
@@ -17,12 +27,7 @@ def validate_required_env_vars(required_vars: List[str], settings: dict) -> List
     Returns:
         List of missing variables
     """
-    missing = []
-    for var in required_vars:
-        value = settings.get(var)
-        if not value or value == "":
-            missing.append(var)
-    return missing
+    return [var for var in required_vars if not settings.get(var)]
 
 
 def validate_port(port: int) -> bool:
@@ -52,14 +57,11 @@ def validate_host(host: str) -> bool:
         return False
 
     # Allow localhost and 0.0.0.0
-    if host in ['localhost', '0.0.0.0', '127.0.0.1']:
+    if host in _LOCAL_HOSTS:
         return True
 
     # Basic hostname/IP validation
-    hostname_pattern = r'^[a-zA-Z0-9]([a-zA-Z0-9\-\.]{0,61}[a-zA-Z0-9])?$'
-    ip_pattern = r'^(\d{1,3}\.){3}\d{1,3}$'
-
-    return bool(re.match(hostname_pattern, host) or re.match(ip_pattern, host))
+    return bool(_HOSTNAME_RE.match(host) or _IP_RE.match(host))
 
 
 def validate_log_level(level: str) -> bool:
@@ -72,5 +74,4 @@ def validate_log_level(level: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    valid_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
-    return level.upper() in valid_levels
+    return level.upper() in _VALID_LOG_LEVELS
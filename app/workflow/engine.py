@@ -5,19 +5,28 @@ The engine manages the execution of complex workflows that involve
 multiple agents working together to complete migration tasks.
 """
 
-from typing import Any, Dict, List, Optional, Callable
+from typing import Any, Dict, List, Optional, Callable, Union
+from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+import graphlib
+import logging
 import structlog
 import asyncio
+import random
+import time
 
 from app.agents.registry import AgentRegistry
-from app.agents.base import Task, AgentResult
+from app.agents.base import Agent, Task, AgentResult
+from app.utils.logging import is_enabled_for
 
 
 logger = structlog.get_logger(__name__)
 
+# Upper bound on the exponential retry delay, in seconds
+_BACKOFF_CAP_S = 8.0
+
 
 class WorkflowStatus(str, Enum):
     """Status of a workflow execution"""
@@ -38,20 +47,33 @@ class WorkflowStepStatus(str, Enum):
     SKIPPED = "skipped"
 
 
-class WorkflowStep(BaseModel):
+# Status members compared by identity on hot paths
+_STEP_COMPLETED = WorkflowStepStatus.COMPLETED
+_STEP_FAILED = WorkflowStepStatus.FAILED
+_STEP_SKIPPED = WorkflowStepStatus.SKIPPED
+_WF_RUNNING = WorkflowStatus.RUNNING
+_WF_COMPLETED = WorkflowStatus.COMPLETED
+_WF_FAILED = WorkflowStatus.FAILED
+
+
+# Steps are mutated on every state transition, so like Task/AgentResult
+# they are a slotted dataclass; Workflow still validates them as a field
+@dataclass(slots=True, kw_only=True)
+class WorkflowStep:
     """Represents a single step in a workflow"""
     id: str
     name: str
     description: str
     agent_name: str
     task: Task
-    dependencies: List[str] = Field(default_factory=list)
+    dependencies: List[str] = field(default_factory=list)
     status: WorkflowStepStatus = WorkflowStepStatus.PENDING
     result: Optional[AgentResult] = None
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     retry_count: int = 0
     max_retries: int = 3
+    duration_ms: Optional[float] = None
 
 
 class WorkflowContext(BaseModel):
@@ -74,9 +96,41 @@ class Workflow(BaseModel):
     completed_at: Optional[datetime] = None
     error: Optional[str] = None
 
+    # Listing payload, rebuilt only when the status changes
+    _snapshot: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return the summary used by the workflow listing.
+
+        Only the status can change after creation, so the cached dict is
+        reused until a status transition. Callers must treat it as
+        read-only.
+        """
+        snapshot = self._snapshot
+        if snapshot is None or snapshot['status'] != self.status.value:
+            snapshot = {
+                "workflow_id": self.id,
+                "name": self.name,
+                "description": self.description,
+                "status": self.status.value,
+                "total_steps": len(self.steps),
+                "created_at": (
+                    snapshot['created_at'] if snapshot is not None
+                    else self.created_at.isoformat()
+                )
+            }
+            self._snapshot = snapshot
+        return snapshot
+
 
 class WorkflowResult(BaseModel):
-    """Result of a workflow execution"""
+    """
+    Result of a workflow execution.
+
+    The engine builds results from its own workflow state, so it uses
+    WorkflowResult.model_construct() to skip revalidating step results.
+    """
     workflow_id: str
     status: WorkflowStatus
     steps_completed: int
@@ -107,16 +161,26 @@ class WorkflowEngine:
         Args:
             agent_registry: Registry of available agents
         """
-        self.agent_registry = agent_registry or AgentRegistry()
+        self.agent_registry = agent_registry or AgentRegistry.get_instance()
         self.workflows: Dict[str, Workflow] = {}
         self.logger = structlog.get_logger("WorkflowEngine")
-        self.event_handlers: Dict[str, List[Callable]] = {
-            'workflow_started': [],
-            'workflow_completed': [],
-            'workflow_failed': [],
-            'step_started': [],
-            'step_completed': [],
-            'step_failed': []
+
+        # Handlers are split into sync/async buckets at registration so
+        # emitting does not have to inspect each handler
+        self.event_handlers: Dict[str, Dict[str, List[Callable]]] = {
+            event: {'sync': [], 'async': []}
+            for event in (
+                'workflow_started',
+                'workflow_completed',
+                'workflow_failed',
+                'step_started',
+                'step_completed',
+                'step_failed'
+            )
+        }
+        # Events with at least one handler; checked first on every emit
+        self._has_handlers: Dict[str, bool] = {
+            event: False for event in self.event_handlers
         }
 
     async def execute_workflow(
@@ -132,28 +196,41 @@ class WorkflowEngine:
         Returns:
             WorkflowResult with execution details
         """
-        start_time = datetime.utcnow()
+        start_ns = time.perf_counter_ns()
         workflow.status = WorkflowStatus.RUNNING
-        workflow.started_at = start_time
+        workflow.started_at = datetime.utcnow()
 
         self.workflows[workflow.id] = workflow
-        self.logger.info(
-            "workflow_started",
-            workflow_id=workflow.id,
-            workflow_name=workflow.name,
-            total_steps=len(workflow.steps)
-        )
+        if is_enabled_for(self.logger, logging.INFO):
+            self.logger.info(
+                "workflow_started",
+                workflow_id=workflow.id,
+                workflow_name=workflow.name,
+                total_steps=len(workflow.steps)
+            )
 
         await self._emit_event('workflow_started', workflow)
 
         try:
+            # Resolve every step's agent up front so a missing agent fails
+            # the workflow before any step runs
+            agents = self.agent_registry.resolve_many(
+                {step.agent_name for step in workflow.steps}
+            )
+            agent_by_step: Dict[str, Agent] = {}
+            for step in workflow.steps:
+                agent = agents[step.agent_name]
+                if not agent:
+                    raise ValueError(f"Agent '{step.agent_name}' not found")
+                agent_by_step[step.id] = agent
+
             # Execute steps in dependency order
-            await self._execute_steps(workflow)
+            await self._execute_steps(workflow, agent_by_step)
 
             # Check if all steps completed successfully
             failed_steps = [
                 step for step in workflow.steps
-                if step.status == WorkflowStepStatus.FAILED
+                if step.status is _STEP_FAILED
             ]
 
             if failed_steps:
@@ -167,14 +244,15 @@ class WorkflowEngine:
             workflow.completed_at = datetime.utcnow()
 
             # Build result
-            result = self._build_workflow_result(workflow, start_time)
-
-            self.logger.info(
-                "workflow_completed",
-                workflow_id=workflow.id,
-                status=workflow.status.value,
-                execution_time_ms=result.execution_time_ms
-            )
+            result = self._build_workflow_result(workflow, start_ns)
+
+            if is_enabled_for(self.logger, logging.INFO):
+                self.logger.info(
+                    "workflow_completed",
+                    workflow_id=workflow.id,
+                    status=workflow.status.value,
+                    execution_time_ms=result.execution_time_ms
+                )
 
             return result
 
@@ -187,43 +265,86 @@ class WorkflowEngine:
                 "workflow_execution_failed",
                 workflow_id=workflow.id,
                 error=str(e),
-                exc_info=True
+                # Tracebacks are costly to format; only attach them when debugging
+                exc_info=is_enabled_for(self.logger, logging.DEBUG)
             )
 
             await self._emit_event('workflow_failed', workflow)
 
-            return self._build_workflow_result(workflow, start_time)
+            return self._build_workflow_result(workflow, start_ns)
 
-    async def _execute_steps(self, workflow: Workflow):
-        """Execute workflow steps in dependency order"""
-        completed_steps = set()
+    async def _execute_steps(self, workflow: Workflow, agent_by_step: Dict[str, Agent]):
+        """
+        Execute workflow steps in dependency order.
+
+        The sorter tracks in-degrees incrementally, so each wave is the set
+        of steps whose dependencies have all completed. Within a wave, steps
+        heading the longest downstream chains are started first.
+        """
         pending_steps = {step.id: step for step in workflow.steps}
 
+        sorter = graphlib.TopologicalSorter()
+        for step in workflow.steps:
+            sorter.add(step.id, *step.dependencies)
+
+        has_missing = any(
+            dep not in pending_steps
+            for step in workflow.steps
+            for dep in step.dependencies
+        )
+        try:
+            sorter.prepare()
+            has_cycle = False
+        except graphlib.CycleError:
+            has_cycle = True
+
+        if has_missing or has_cycle:
+            raise RuntimeError(
+                f"Circular dependency or missing dependencies detected. "
+                f"Remaining steps: {list(pending_steps.keys())}"
+            )
+
+        # Length of the longest chain each step heads, filled dependents-first
+        successors: Dict[str, List[str]] = {step_id: [] for step_id in pending_steps}
+        for step in workflow.steps:
+            for dep in step.dependencies:
+                successors[dep].append(step.id)
+        graph = {step.id: step.dependencies for step in workflow.steps}
+        rank: Dict[str, int] = {}
+        for step_id in reversed(list(graphlib.TopologicalSorter(graph).static_order())):
+            rank[step_id] = 1 + max(
+                (rank[succ] for succ in successors[step_id]),
+                default=0
+            )
+
         while pending_steps:
-            # Find steps ready to execute (dependencies satisfied)
+            # Steps whose dependencies are satisfied, critical path first
             ready_steps = [
-                step for step in pending_steps.values()
-                if all(dep in completed_steps for dep in step.dependencies)
+                pending_steps[step_id]
+                for step_id in sorted(sorter.get_ready(), key=rank.__getitem__, reverse=True)
             ]
 
             if not ready_steps:
-                # No steps ready - check for circular dependencies
+                # Remaining steps depend on a failed step
                 remaining = list(pending_steps.keys())
                 raise RuntimeError(
                     f"Circular dependency or missing dependencies detected. "
                     f"Remaining steps: {remaining}"
                 )
 
-            # Execute ready steps in parallel
-            tasks = [
-                self._execute_step(workflow, step)
-                for step in ready_steps
-            ]
-
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            # Execute ready steps in parallel; cancelling the workflow
+            # cancels every step in the wave
+            async with asyncio.TaskGroup() as tg:
+                tasks = [
+                    tg.create_task(
+                        self._guarded_step(workflow, step, agent_by_step[step.id])
+                    )
+                    for step in ready_steps
+                ]
 
             # Process results
-            for step, result in zip(ready_steps, results):
+            for step, task in zip(ready_steps, tasks):
+                result = task.result()
                 if isinstance(result, Exception):
                     step.status = WorkflowStepStatus.FAILED
                     self.logger.error(
@@ -233,49 +354,66 @@ class WorkflowEngine:
                         error=str(result)
                     )
                 else:
-                    completed_steps.add(step.id)
+                    sorter.done(step.id)
 
                 # Remove from pending
                 pending_steps.pop(step.id, None)
 
+    async def _guarded_step(
+        self,
+        workflow: Workflow,
+        step: WorkflowStep,
+        agent: Agent
+    ) -> Union[AgentResult, Exception]:
+        """
+        Run a step, returning its exception instead of raising it so one
+        failing step does not cancel the rest of its wave.
+        """
+        try:
+            return await self._execute_step(workflow, step, agent)
+        except Exception as e:
+            return e
+
     async def _execute_step(
         self,
         workflow: Workflow,
-        step: WorkflowStep
+        step: WorkflowStep,
+        agent: Agent
     ) -> AgentResult:
         """Execute a single workflow step"""
         step.status = WorkflowStepStatus.RUNNING
         step.started_at = datetime.utcnow()
 
-        self.logger.info(
-            "step_started",
-            workflow_id=workflow.id,
-            step_id=step.id,
-            step_name=step.name,
-            agent=step.agent_name
-        )
+        # Per-step start records are debug-only; step_completed carries
+        # the same fields, so a successful step logs one record at INFO
+        if is_enabled_for(self.logger, logging.DEBUG):
+            self.logger.debug(
+                "step_started",
+                workflow_id=workflow.id,
+                step_id=step.id,
+                step_name=step.name,
+                agent=step.agent_name
+            )
 
         await self._emit_event('step_started', workflow, step)
 
-        # Get the agent
-        agent = self.agent_registry.get_agent(step.agent_name)
-        if not agent:
-            raise ValueError(f"Agent '{step.agent_name}' not found")
+        # Add workflow context to task once, before the retry loop; the
+        # shared dict is passed by reference, so nothing is copied
+        step.task.context.update({
+            'workflow_id': workflow.id,
+            'workflow_context': workflow.context.data
+        })
 
         # Execute with retry logic
         last_error = None
         for attempt in range(step.max_retries + 1):
             try:
-                # Add workflow context to task
-                step.task.context.update({
-                    'workflow_id': workflow.id,
-                    'workflow_context': workflow.context.data
-                })
-
                 # Execute the agent task
+                attempt_ns = time.perf_counter_ns()
                 result = await agent.execute(step.task)
 
                 if result.success:
+                    step.duration_ms = (time.perf_counter_ns() - attempt_ns) / 1_000_000
                     step.status = WorkflowStepStatus.COMPLETED
                     step.result = result
                     step.completed_at = datetime.utcnow()
@@ -284,44 +422,35 @@ class WorkflowEngine:
                     if result.data:
                         workflow.context.data[f"step_{step.id}_result"] = result.data
 
-                    self.logger.info(
-                        "step_completed",
-                        workflow_id=workflow.id,
-                        step_id=step.id,
-                        execution_time_ms=result.execution_time_ms
-                    )
+                    if is_enabled_for(self.logger, logging.INFO):
+                        self.logger.info(
+                            "step_completed",
+                            workflow_id=workflow.id,
+                            step_id=step.id,
+                            step_name=step.name,
+                            agent=step.agent_name,
+                            attempts=attempt + 1,
+                            execution_time_ms=result.execution_time_ms,
+                            duration_ms=step.duration_ms
+                        )
 
                     await self._emit_event('step_completed', workflow, step)
                     return result
                 else:
                     last_error = result.error
                     if attempt < step.max_retries:
-                        step.retry_count += 1
-                        self.logger.warning(
-                            "step_failed_retrying",
-                            workflow_id=workflow.id,
-                            step_id=step.id,
-                            attempt=attempt + 1,
-                            max_retries=step.max_retries,
-                            error=result.error
+                        await self._sleep_retry(
+                            "step_failed_retrying", workflow, step, attempt, result.error
                         )
-                        await asyncio.sleep(2 ** attempt)  # Exponential backoff
                     else:
                         raise RuntimeError(result.error)
 
             except Exception as e:
                 last_error = str(e)
                 if attempt < step.max_retries:
-                    step.retry_count += 1
-                    self.logger.warning(
-                        "step_exception_retrying",
-                        workflow_id=workflow.id,
-                        step_id=step.id,
-                        attempt=attempt + 1,
-                        max_retries=step.max_retries,
-                        error=str(e)
+                    await self._sleep_retry(
+                        "step_exception_retrying", workflow, step, attempt, last_error
                     )
-                    await asyncio.sleep(2 ** attempt)
                 else:
                     raise
 
@@ -340,36 +469,52 @@ class WorkflowEngine:
 
         raise RuntimeError(f"Step failed after {step.max_retries} retries: {last_error}")
 
+    async def _sleep_retry(
+        self,
+        event: str,
+        workflow: Workflow,
+        step: WorkflowStep,
+        attempt: int,
+        error: Optional[str]
+    ):
+        """Record a retry and wait a capped, jittered exponential backoff"""
+        step.retry_count += 1
+        if is_enabled_for(self.logger, logging.WARNING):
+            self.logger.warning(
+                event,
+                workflow_id=workflow.id,
+                step_id=step.id,
+                attempt=attempt + 1,
+                max_retries=step.max_retries,
+                error=error
+            )
+        # Jitter keeps steps that failed together from retrying in lockstep
+        delay = min(2 ** attempt, _BACKOFF_CAP_S) * (0.5 + random.random() * 0.5)
+        await asyncio.sleep(delay)
+
     def _build_workflow_result(
         self,
         workflow: Workflow,
-        start_time: datetime
+        start_ns: int
     ) -> WorkflowResult:
         """Build workflow result from workflow state"""
-        execution_time = (
-            (workflow.completed_at or datetime.utcnow()) - start_time
-        ).total_seconds() * 1000
-
-        steps_completed = sum(
-            1 for step in workflow.steps
-            if step.status == WorkflowStepStatus.COMPLETED
-        )
-        steps_failed = sum(
-            1 for step in workflow.steps
-            if step.status == WorkflowStepStatus.FAILED
-        )
-        steps_skipped = sum(
-            1 for step in workflow.steps
-            if step.status == WorkflowStepStatus.SKIPPED
-        )
-
-        results = {
-            step.id: step.result
-            for step in workflow.steps
-            if step.result is not None
-        }
-
-        return WorkflowResult(
+        execution_time = (time.perf_counter_ns() - start_ns) / 1_000_000
+
+        # Tally statuses and collect results in a single pass
+        steps_completed = steps_failed = steps_skipped = 0
+        results = {}
+        for step in workflow.steps:
+            status = step.status
+            if status is _STEP_COMPLETED:
+                steps_completed += 1
+            elif status is _STEP_FAILED:
+                steps_failed += 1
+            elif status is _STEP_SKIPPED:
+                steps_skipped += 1
+            if step.result is not None:
+                results[step.id] = step.result
+
+        return WorkflowResult.model_construct(
             workflow_id=workflow.id,
             status=workflow.status,
             steps_completed=steps_completed,
@@ -401,40 +546,57 @@ class WorkflowEngine:
     def on(self, event: str, handler: Callable):
         """Register an event handler"""
         if event in self.event_handlers:
-            self.event_handlers[event].append(handler)
+            bucket = 'async' if asyncio.iscoroutinefunction(handler) else 'sync'
+            self.event_handlers[event][bucket].append(handler)
+            self._has_handlers[event] = True
         else:
             raise ValueError(f"Unknown event: {event}")
 
     async def _emit_event(self, event: str, *args):
         """Emit an event to all registered handlers"""
-        for handler in self.event_handlers.get(event, []):
+        if not self._has_handlers.get(event):
+            return
+
+        handlers = self.event_handlers[event]
+        for handler in handlers['sync']:
             try:
-                if asyncio.iscoroutinefunction(handler):
-                    await handler(*args)
-                else:
-                    handler(*args)
+                handler(*args)
             except Exception as e:
-                self.logger.error(
-                    "event_handler_failed",
-                    event=event,
-                    error=str(e),
-                    exc_info=True
-                )
+                self._log_handler_error(event, e)
+
+        if handlers['async']:
+            results = await asyncio.gather(
+                *(handler(*args) for handler in handlers['async']),
+                return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    self._log_handler_error(event, result)
+
+    def _log_handler_error(self, event: str, error: Exception):
+        """Log an exception raised by an event handler"""
+        self.logger.error(
+            "event_handler_failed",
+            event_name=event,
+            error=str(error),
+            exc_info=error if is_enabled_for(self.logger, logging.DEBUG) else False
+        )
 
     def get_engine_stats(self) -> Dict[str, Any]:
         """Get workflow engine statistics"""
+        running = completed = failed = 0
+        for workflow in self.workflows.values():
+            status = workflow.status
+            if status is _WF_RUNNING:
+                running += 1
+            elif status is _WF_COMPLETED:
+                completed += 1
+            elif status is _WF_FAILED:
+                failed += 1
+
         return {
             'total_workflows': len(self.workflows),
-            'running_workflows': sum(
-                1 for w in self.workflows.values()
-                if w.status == WorkflowStatus.RUNNING
-            ),
-            'completed_workflows': sum(
-                1 for w in self.workflows.values()
-                if w.status == WorkflowStatus.COMPLETED
-            ),
-            'failed_workflows': sum(
-                1 for w in self.workflows.values()
-                if w.status == WorkflowStatus.FAILED
-            )
+            'running_workflows': running,
+            'completed_workflows': completed,
+            'failed_workflows': failed
         }